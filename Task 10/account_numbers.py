@@ -0,0 +1,99 @@
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Version 1 numbers are "ACC-" and 4 digits, 1000 to 9999. Larger numbers
+# use version 2: "ACC2-" and 12 digits. Each number has one spelling only.
+LEGACY_MAX = 9999
+PREFIX = "ACC2-"
+DIGITS = 12
+# The counter file holds one fixed-width number, so every update is a
+# single same-size write at offset 0.
+COUNTER_WIDTH = 20
+
+
+def format_account_number(number):
+    if 1000 <= number <= LEGACY_MAX:
+        return f"ACC-{number}"
+    if LEGACY_MAX < number < 10 ** DIGITS:
+        return f"{PREFIX}{number:0{DIGITS}d}"
+    raise ValueError(f"Account number {number} is out of range.")
+
+
+class LocalAllocator:
+    """Thread-safe account numbers for a single process."""
+
+    def __init__(self, start=1000):
+        self._next = start
+        self._lock = threading.Lock()
+
+    def next_number(self):
+        with self._lock:
+            number = self._next
+            self._next += 1
+        return format_account_number(number)
+
+
+class BlockAllocator:
+    """Account numbers shared by several processes through a counter file.
+
+    A process takes the file lock only to lease `block_size` numbers at a
+    time, then hands them out from memory, so workers rarely contend.
+    Numbers are unique across processes but not in creation order, and a
+    process that exits leaves the rest of its block unused.
+    """
+
+    def __init__(self, counter_path, block_size=1000, start=1000):
+        self.counter_path = counter_path
+        self.block_size = block_size
+        self.start = start
+        self._next = self._end = 0
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def next_number(self):
+        with self._lock:
+            # A forked child must not reuse the block its parent leased.
+            if self._next == self._end or self._pid != os.getpid():
+                self._lease()
+            number = self._next
+            self._next += 1
+        return format_account_number(number)
+
+    def _lease(self):
+        fd = os.open(self.counter_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock_file(fd)
+            try:
+                text = os.read(fd, COUNTER_WIDTH).strip()
+                start = int(text) if text else self.start
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, f"{start + self.block_size:0{COUNTER_WIDTH}d}".encode())
+                os.fsync(fd)
+            finally:
+                _unlock_file(fd)
+        finally:
+            os.close(fd)
+        self._next, self._end = start, start + self.block_size
+        self._pid = os.getpid()
+
+
+def _lock_file(fd):
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(fd):
+    if fcntl:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
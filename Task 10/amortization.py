@@ -0,0 +1,91 @@
+import numpy as np
+
+
+class Schedule:
+    """Month-by-month amortization for a group of loans.
+
+    `payment` has one entry per loan; `interest`, `principal` and `balance`
+    are (loans, months) arrays where column k is month k + 1. Loans shorter
+    than the longest one are padded with zeros after their last month.
+    """
+
+    def __init__(self, payment, interest, principal, balance):
+        self.payment = payment
+        self.interest = interest
+        self.principal = principal
+        self.balance = balance
+
+    def __len__(self):
+        return len(self.payment)
+
+
+def loan_payments(principals, annual_rates, years):
+    """Monthly payment for every loan, the array form of
+    BankAccount.calculate_loan_payment. Arguments broadcast against each
+    other, so one rate or term can be shared by the whole book."""
+    principals, monthly_rates, months = _broadcast(principals, annual_rates, years)
+    return _payments(principals, monthly_rates, months)
+
+
+def amortization_schedule(principals, annual_rates, years):
+    principals, monthly_rates, months = _broadcast(principals, annual_rates, years)
+    payment = _payments(principals, monthly_rates, months)
+    if payment.ndim == 0:
+        principals, monthly_rates, months, payment = (
+            np.atleast_1d(a) for a in (principals, monthly_rates, months, payment))
+
+    # Closed form for the balance after k payments, so every month of every
+    # loan is computed at once instead of stepping month by month:
+    #   B_k = P(1+r)^k - payment((1+r)^k - 1) / r,  or P - payment*k when r = 0.
+    k = np.arange(months.max(initial=0) + 1, dtype=np.float64)
+    rate = monthly_rates[:, None]
+    growth = (1 + rate) ** k
+    with np.errstate(divide='ignore', invalid='ignore'):
+        balance = np.where(rate == 0,
+                           principals[:, None] - payment[:, None] * k,
+                           principals[:, None] * growth
+                           - payment[:, None] * (growth - 1) / rate)
+    # Rounding leaves a few fractions of a cent at the end; close the loan.
+    balance[k >= months[:, None]] = 0
+
+    interest = balance[:, :-1] * rate
+    principal = balance[:, :-1] - balance[:, 1:]
+    active = k[1:] <= months[:, None]
+    interest[~active] = 0
+    principal[~active] = 0
+    return Schedule(payment, interest, principal, balance[:, 1:])
+
+
+def iter_schedules(principals, annual_rates, years, chunk_size=10_000):
+    """Yield (first loan index, Schedule) for `chunk_size` loans at a time.
+
+    Only one chunk of schedules is in memory at once. The inputs are read
+    a slice at a time, so they can be np.memmap arrays over a loan book
+    too large for RAM.
+    """
+    # Broadcast without converting: a dtype change would copy a whole
+    # memmap into RAM. amortization_schedule converts each slice instead.
+    principals, annual_rates, years = np.broadcast_arrays(
+        np.asarray(principals), np.asarray(annual_rates), np.asarray(years))
+    for start in range(0, len(principals), chunk_size):
+        end = start + chunk_size
+        yield start, amortization_schedule(principals[start:end], annual_rates[start:end],
+                                           years[start:end])
+
+
+def _broadcast(principals, annual_rates, years):
+    principals, annual_rates, years = np.broadcast_arrays(
+        np.asarray(principals, dtype=np.float64), np.asarray(annual_rates, dtype=np.float64),
+        np.asarray(years, dtype=np.float64))
+    months = np.rint(years * 12).astype(np.int64)
+    if (months <= 0).any():
+        raise ValueError("Loan terms must be at least one month.")
+    return principals, annual_rates / 12, months
+
+
+def _payments(principals, monthly_rates, months):
+    # Same formula and operation order as calculate_loan_payment.
+    growth = (1 + monthly_rates) ** months
+    with np.errstate(divide='ignore', invalid='ignore'):
+        payment = principals * (monthly_rates * growth) / (growth - 1)
+    return np.where(monthly_rates == 0, principals / months, payment)
@@ -0,0 +1,112 @@
+import numpy as np
+
+# Compounding periods per year.
+COMPOUNDING = {'daily': 365, 'monthly': 12}
+
+
+class BalanceStore:
+    """Balances and active flags for many accounts, one NumPy column each.
+
+    Row i belongs to account_numbers[i]. Operations that touch every
+    account, such as accruing interest, run as one array operation instead
+    of a method call per BankAccount object. `balances` and `is_active` are
+    views of the rows in use; the arrays behind them keep spare capacity.
+    """
+
+    def __init__(self):
+        self.account_numbers = []
+        self._rows = {}
+        self._balances = np.zeros(0, dtype=np.float64)
+        self._is_active = np.zeros(0, dtype=bool)
+        self._size = 0
+
+    @classmethod
+    def from_accounts(cls, accounts):
+        accounts = list(accounts)
+        store = cls()
+        store.account_numbers = [account.account_number for account in accounts]
+        store._rows = {number: row for row, number in enumerate(store.account_numbers)}
+        store._balances = np.fromiter((account.balance for account in accounts),
+                                      dtype=np.float64, count=len(accounts))
+        store._is_active = np.fromiter((account.is_active for account in accounts),
+                                       dtype=bool, count=len(accounts))
+        store._size = len(accounts)
+        return store
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def balances(self):
+        return self._balances[:self._size]
+
+    @property
+    def is_active(self):
+        return self._is_active[:self._size]
+
+    def add(self, account_number, balance=0, is_active=True):
+        if account_number in self._rows:
+            raise ValueError(f"Account {account_number} is already in the store.")
+        if self._size == len(self._balances):
+            # Grow geometrically so adding one account at a time stays O(1).
+            capacity = max(16, 2 * self._size)
+            self._balances = _grow(self._balances, capacity)
+            self._is_active = _grow(self._is_active, capacity)
+        self._balances[self._size] = balance
+        self._is_active[self._size] = is_active
+        self._rows[account_number] = self._size
+        self.account_numbers.append(account_number)
+        self._size += 1
+
+    def balance(self, account_number):
+        return float(self._balances[self._rows[account_number]])
+
+    def set_active(self, account_number, is_active):
+        self._is_active[self._rows[account_number]] = is_active
+
+    def sync_to(self, accounts):
+        """Copy balances back onto BankAccount objects."""
+        for account in accounts:
+            account.balance = float(self._balances[self._rows[account.account_number]])
+
+    def accrue_interest(self, annual_rate, periods=1, compounding='monthly', rate_changes=()):
+        """Credit compound interest to every active account; returns the total.
+
+        `periods` is counted in compounding periods (days or months).
+        `rate_changes` lists (period, new annual rate) pairs for rates that
+        change part way through, e.g. [(15, 0.03)] switches to 3% after day
+        15. Fractional periods are pro-rated.
+        """
+        factor = growth_factor(annual_rate, periods, compounding, rate_changes)
+        balances = self.balances
+        active = self.is_active
+        interest = balances * (factor - 1)
+        interest[~active] = 0
+        balances += interest
+        return float(interest.sum())
+
+
+def _grow(column, capacity):
+    # Zero-filled, unlike np.resize, which repeats the existing values.
+    grown = np.zeros(capacity, dtype=column.dtype)
+    grown[:len(column)] = column
+    return grown
+
+
+def growth_factor(annual_rate, periods, compounding='monthly', rate_changes=()):
+    """How much one unit grows over `periods`, with mid-period rate changes.
+
+    The rate applies to all accounts alike, so the factor is worked out
+    once and the per-account work is a single multiplication.
+    """
+    if compounding not in COMPOUNDING:
+        raise ValueError(f"Compounding must be one of: {', '.join(COMPOUNDING)}.")
+    per_year = COMPOUNDING[compounding]
+    factor = 1.0
+    start, rate = 0, annual_rate
+    for change_at, new_rate in sorted(rate_changes):
+        if not 0 <= change_at <= periods:
+            raise ValueError("Rate changes must fall within the accrual period.")
+        factor *= (1 + rate / per_year) ** (change_at - start)
+        start, rate = change_at, new_rate
+    return factor * (1 + rate / per_year) ** (periods - start)
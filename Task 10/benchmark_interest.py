@@ -0,0 +1,53 @@
+import importlib.util
+import os
+import random
+import time
+
+from balance_store import BalanceStore, growth_factor
+
+# The script's file name is not a valid module name.
+spec = importlib.util.spec_from_file_location(
+    'class_static_method', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                        'class&static_method.py'))
+class_static_method = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(class_static_method)
+BankAccount = class_static_method.BankAccount
+
+
+def bench_interest(count=1_000_000):
+    random.seed(1)
+    accounts = [BankAccount(f"Holder {i}", random.randint(0, 100_000)) for i in range(count)]
+    for account in random.sample(accounts, count // 10):
+        account.is_active = False
+    # A month of daily compounding with a rate change on day 15.
+    rate_changes = [(15, 0.03)]
+
+    start = time.perf_counter()
+    store = BalanceStore.from_accounts(accounts)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    credited = BankAccount.accrue_interest(store, 30, 'daily', rate_changes)
+    columnar = time.perf_counter() - start
+
+    # One object at a time, the only option without the store.
+    factor = growth_factor(BankAccount.interest_rate, 30, 'daily', rate_changes)
+    start = time.perf_counter()
+    for account in accounts:
+        if account.is_active:
+            account.balance += account.balance * (factor - 1)
+    loop = time.perf_counter() - start
+
+    mismatched = sum(1 for account, balance in zip(accounts, store.balances)
+                     if abs(account.balance - balance) > 1e-6)
+
+    print(f"{count:,} accounts, 30 days of daily compounding, rate change on day 15")
+    print(f"Build store:     {build:.3f} s (once; reused for every accrual)")
+    print(f"Per-object loop: {loop:.3f} s ({count / loop:,.0f} accounts/s)")
+    print(f"Columnar store:  {columnar:.3f} s ({count / columnar:,.0f} accounts/s)")
+    print(f"Interest credited: ${credited:,.2f}")
+    print(f"Accounts differing from the loop: {mismatched}")
+
+
+if __name__ == "__main__":
+    bench_interest()
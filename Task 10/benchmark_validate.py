@@ -0,0 +1,63 @@
+import importlib.util
+import os
+import random
+import tempfile
+import time
+
+from bulk_validate import iter_invalid
+
+# The script's file name is not a valid module name.
+spec = importlib.util.spec_from_file_location(
+    'class_static_method', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                        'class&static_method.py'))
+class_static_method = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(class_static_method)
+BankAccount = class_static_method.BankAccount
+
+
+def write_export(path, count, seed=1):
+    rng = random.Random(seed)
+    bad = ["ACC-12", "acc-1234", "ACC2-000000001234", "ACC-12a4", ""]
+    with open(path, 'w') as file:
+        file.write("account_number,holder\n")
+        for i in range(count):
+            if rng.random() < 0.01:
+                number = rng.choice(bad)
+            elif rng.random() < 0.5:
+                number = f"ACC-{rng.randint(1000, 9999)}"
+            else:
+                number = f"ACC2-{rng.randint(10_000, 10 ** 12 - 1):012d}"
+            file.write(f"{number},Holder {i}\n")
+
+
+def bench_validate(count=5_000_000, processes=4):
+    path = os.path.join(tempfile.mkdtemp(), 'accounts.csv')
+    write_export(path, count)
+    size = os.path.getsize(path) / 1e6
+
+    # One validate_account_number call per row.
+    start = time.perf_counter()
+    with open(path) as file:
+        next(file)
+        loop = [(number, line) for number, line in enumerate(file, 2)
+                if not BankAccount.validate_account_number(line.split(',', 1)[0])]
+    per_row = time.perf_counter() - start
+
+    start = time.perf_counter()
+    streamed = list(iter_invalid(path, header=True))
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pooled = list(iter_invalid(path, header=True, processes=processes))
+    parallel = time.perf_counter() - start
+
+    print(f"{count:,} rows ({size:.0f} MB), {len(streamed):,} invalid")
+    print(f"validate_account_number loop: {per_row:.2f} s ({count / per_row:,.0f} rows/s)")
+    print(f"iter_invalid:                 {single:.2f} s ({count / single:,.0f} rows/s)")
+    print(f"iter_invalid, {processes} processes:    {parallel:.2f} s ({count / parallel:,.0f} rows/s)")
+    print(f"Same rows reported: {[n for n, _ in loop] == [n for n, _ in streamed] == [n for n, _ in pooled]}")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    bench_validate()
@@ -0,0 +1,114 @@
+import csv
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+# Same rules as BankAccount.validate_account_number: ACC- and 4 digits, or
+# ACC2- and 12 digits for numbers above 9999 (the first 8 not all zero).
+ACCOUNT_NUMBER = re.compile(r"ACC-[0-9]{4}|ACC2-(?!0{8})[0-9]{12}")
+
+# Bytes of the file each worker validates per task.
+RANGE_SIZE = 64 * 1024 * 1024
+
+
+def iter_invalid(source, column=0, header=False, chunk_size=100_000, processes=1):
+    """Yield (line number, value) for every invalid account number.
+
+    `source` is a CSV file path or any iterable of lines, such as an open
+    file. Lines are read `chunk_size` at a time, so memory stays flat
+    however long the input is. Each record must be on one line (no quoted
+    line breaks), as in a plain CSV export.
+
+    With `processes` > 1 a file is split into byte ranges that worker
+    processes read and check themselves, and results come back in line
+    order. Worth it for multi-GB files; the pool start-up costs more than
+    it saves on small ones.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if processes > 1:
+            yield from _iter_invalid_parallel(source, column, header, chunk_size, processes)
+            return
+        with open(source, encoding='utf-8', newline='') as file:
+            yield from _iter_invalid_lines(file, column, header, chunk_size)
+    else:
+        yield from _iter_invalid_lines(source, column, header, chunk_size)
+
+
+def _iter_invalid_lines(lines, column, header, chunk_size):
+    lines = iter(lines)
+    line_number = 0
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        for index, value in _check_chunk(chunk, column):
+            if not (header and line_number + index == 0):
+                yield line_number + index + 1, value
+        line_number += len(chunk)
+
+
+def _iter_invalid_parallel(path, column, header, chunk_size, processes):
+    size = os.path.getsize(path)
+    ranges = [(path, start, min(start + RANGE_SIZE, size), column, chunk_size)
+              for start in range(0, size, RANGE_SIZE)]
+    line_number = 0
+    with ProcessPoolExecutor(processes) as pool:
+        for line_count, invalid in pool.map(_check_range, ranges):
+            for index, value in invalid:
+                if not (header and line_number + index == 0):
+                    yield line_number + index + 1, value
+            line_number += line_count
+
+
+def _check_range(task):
+    """Check the lines that start inside [start, end) of the file.
+
+    Returns the number of lines and the invalid ones as (index in range,
+    value) pairs.
+    """
+    path, start, end, column, chunk_size = task
+    invalid = []
+    line_count = 0
+    with open(path, 'rb') as file:
+        position = start
+        if start:
+            # The line that straddles `start` belongs to the previous range.
+            file.seek(start - 1)
+            position += len(file.readline()) - 1
+        while position < end:
+            chunk = []
+            for line in file:
+                chunk.append(line.decode('utf-8'))
+                position += len(line)
+                if position >= end or len(chunk) == chunk_size:
+                    break
+            if not chunk:
+                break
+            invalid.extend((line_count + index, value)
+                           for index, value in _check_chunk(chunk, column))
+            line_count += len(chunk)
+    return line_count, invalid
+
+
+def _check_chunk(lines, column):
+    fast = _line_pattern(column).match
+    full = ACCOUNT_NUMBER.fullmatch
+    invalid = []
+    for index, matched in enumerate(map(fast, lines)):
+        if matched is None:
+            # Invalid values and quoted fields land here; parse the line
+            # properly before deciding.
+            row = next(csv.reader([lines[index]]), [])
+            value = row[column] if len(row) > column else ''
+            if full(value) is None:
+                invalid.append((index, value))
+    return invalid
+
+
+@lru_cache(maxsize=None)
+def _line_pattern(column):
+    # A whole unquoted line whose field `column` is a valid number, checked
+    # in one regex call without splitting the line.
+    return re.compile(rf'(?:[^,"\r\n]*,){{{column}}}(?:{ACCOUNT_NUMBER.pattern})(?:,|\r?\n?\Z)')
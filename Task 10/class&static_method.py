@@ -1,13 +1,19 @@
+from account_numbers import LocalAllocator
+
+
 class BankAccount:
     # Class variables
     bank_name = "Global Banking Corp."
     interest_rate = 0.02  # 2% annual interest rate
     total_accounts = 0
+    # Hands out account numbers; worker processes that create accounts
+    # should share an account_numbers.BlockAllocator instead.
+    number_allocator = LocalAllocator(start=1000)
     
     def __init__(self, account_holder, balance=0):
         self.account_holder = account_holder
         self.balance = balance
-        self.account_number = f"ACC-{BankAccount.total_accounts + 1000}"
+        self.account_number = BankAccount.number_allocator.next_number()
         self.is_active = True
         BankAccount.total_accounts += 1
     
@@ -36,18 +42,29 @@ class BankAccount:
             return f"Interest rate updated to {new_rate:.1%}"
         return "Invalid interest rate"
     
+    @classmethod
+    def accrue_interest(cls, store, periods=1, compounding='monthly', rate_changes=()):
+        # Credits interest at the class-wide rate to every active account in a
+        # BalanceStore (balance_store.py) in one pass; returns the total.
+        return store.accrue_interest(cls.interest_rate, periods, compounding, rate_changes)
+    
     @staticmethod
     def validate_account_number(account_number):
         if not isinstance(account_number, str):
             return False
         
-        # Check format (ACC-followed by 4 digits)
-        if not (account_number.startswith("ACC-") and 
-                len(account_number) == 8 and 
-                account_number[4:].isdigit()):
-            return False
-            
-        return True
+        # Check format (ACC- followed by 4 digits)
+        if account_number.startswith("ACC-"):
+            digits = account_number[4:]
+            return len(digits) == 4 and digits.isascii() and digits.isdigit()
+        
+        # Version 2 format (ACC2- followed by 12 digits) for numbers above 9999
+        if account_number.startswith("ACC2-"):
+            digits = account_number[5:]
+            return (len(digits) == 12 and digits.isascii() and digits.isdigit()
+                    and int(digits) > 9999)
+        
+        return False
     
     @staticmethod
     def calculate_loan_payment(principal, annual_rate, years):
@@ -61,6 +78,13 @@ class BankAccount:
         
         monthly_payment = principal * (monthly_rate * (1 + monthly_rate)**months) / ((1 + monthly_rate)**months - 1)
         return monthly_payment
+    
+    @staticmethod
+    def calculate_loan_payments(principals, annual_rates, years):
+        # Array version for whole loan books (needs NumPy); see amortization.py
+        # for month-by-month schedules.
+        from amortization import loan_payments
+        return loan_payments(principals, annual_rates, years)
 
 
 # Demonstration
@@ -89,6 +113,8 @@ if __name__ == "__main__":
     # Use static methods - note they don't change any instance or class state
     account_to_validate = "ACC-1234"
     print(f"Is {account_to_validate} valid? {BankAccount.validate_account_number(account_to_validate)}")
+    account_to_validate = "ACC2-000000012345"
+    print(f"Is {account_to_validate} valid? {BankAccount.validate_account_number(account_to_validate)}")
     
     # Calculate loan payment using static method
     loan_amount = 10000
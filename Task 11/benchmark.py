@@ -0,0 +1,202 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from book_index import BookIndex
+from columnar import ColumnarCatalog
+from journal import BookJournal, iter_json_array
+from listing import PAGE_SIZE, iter_pages, render_page, show_pages
+from storage import JsonStorage, SqliteStorage, import_json
+
+
+FIRST_NAMES = ['Jane', 'George', 'Harper', 'Herman', 'Aldous', 'Mary', 'Leo', 'Virginia',
+               'Franz', 'Toni', 'Ursula', 'Isaac', 'Agatha', 'Pramoedya', 'Chinua', 'Haruki']
+LAST_NAMES = ['Austen', 'Orwell', 'Lee', 'Melville', 'Huxley', 'Shelley', 'Tolstoy', 'Woolf',
+              'Kafka', 'Morrison', 'Le Guin', 'Asimov', 'Christie', 'Toer', 'Achebe', 'Murakami',
+              'Hirata', 'Dickens', 'Bronte', 'Eliot']
+
+
+def make_books(count):
+    genres = ['Fiction', 'Science', 'History', 'Poetry', 'Fantasy']
+    return [
+        {
+            'title': f"Book {i}",
+            'author': f"{FIRST_NAMES[i % 16]} {LAST_NAMES[i // 16 % 20]} {i // 320 % 10}",
+            'year': str(1900 + i % 125),
+            'genre': genres[i % len(genres)],
+            'borrowed': i % 3 == 0
+        }
+        for i in range(count)
+    ]
+
+
+def bench_save(catalog_size=100_000, writes=20):
+    # Compare one add per write: full json.dump rewrite vs journal append.
+    books = make_books(catalog_size)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'books.json')
+
+        start = time.perf_counter()
+        for i in range(writes):
+            books.append({'title': f"New {i}", 'author': 'Someone', 'year': '2024',
+                          'genre': 'Fiction', 'borrowed': False})
+            with open(path, 'w') as file:
+                json.dump(books, file)
+        rewrite = (time.perf_counter() - start) / writes
+
+        journal = BookJournal(path, compact_threshold=float('inf'))
+        journal.load()
+        start = time.perf_counter()
+        for i in range(writes):
+            book = {'title': f"New {i}", 'author': 'Someone', 'year': '2024',
+                    'genre': 'Fiction', 'borrowed': False}
+            journal.books.append(book)
+            journal.record_add(book)
+        append = (time.perf_counter() - start) / writes
+        journal.close()
+
+    print(f"Catalog size: {catalog_size} books, {writes} writes")
+    print(f"Full rewrite:   {rewrite * 1000:.3f} ms per write")
+    print(f"Journal append: {append * 1000:.3f} ms per write")
+    print(f"Speedup: {rewrite / append:.0f}x")
+
+
+def bench_search(catalog_size=100_000, queries=200):
+    # Compare an author + year range query: list scan vs BookIndex.
+    books = make_books(catalog_size)
+
+    start = time.perf_counter()
+    index = BookIndex(books)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    authors = [books[i * 97 % catalog_size]['author'] for i in range(queries)]
+    for author in authors:
+        author = author.lower()
+        scanned = [book for book in books
+                   if book['author'].lower() == author and 1950 <= int(book['year']) <= 1960]
+    scan = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for author in authors:
+        found = index.search(author=author, year_from=1950, year_to=1960)
+    indexed = (time.perf_counter() - start) / queries
+    assert len(found) == len(scanned)
+
+    print(f"Catalog size: {catalog_size} books, {queries} queries")
+    print(f"Index build:  {build * 1000:.1f} ms")
+    print(f"List scan:    {scan * 1000:.3f} ms per query")
+    print(f"Index search: {indexed * 1000:.3f} ms per query")
+
+
+def print_all_books(books):
+    # The previous list_books(): seven print calls per book.
+    for index, book in enumerate(books):
+        print("-" * 20)
+        print(f"Number: {index + 1}")
+        print(f"Title: {book['title']}")
+        print(f"Author: {book['author']}")
+        print(f"Year: {book['year']}")
+        print(f"Genre: {book['genre']}")
+        print(f"Borrowed: {'Yes' if book['borrowed'] else 'No'}")
+    print("-" * 20)
+
+
+def bench_listing(catalog_size=100_000):
+    # Render a 100k-book file to /dev/null: old per-field prints vs
+    # buffered pages, plus the cost of showing only the first page.
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'books.json')
+        with open(path, 'w') as file:
+            json.dump(make_books(catalog_size), file)
+        with open(path, 'r') as file:
+            books = json.load(file)
+
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            print_all_books(books)
+            old = time.perf_counter() - start
+
+        start = time.perf_counter()
+        show_pages(enumerate(books, start=1), len(books), pause=False, out=devnull)
+        paged = time.perf_counter() - start
+
+        start = time.perf_counter()
+        devnull.write(render_page(next(iter_pages(enumerate(books, start=1)))))
+        first = time.perf_counter() - start
+
+    print(f"Catalog size: {catalog_size} books, {PAGE_SIZE} per page")
+    print(f"Print per field:   {old * 1000:.1f} ms for the whole catalog")
+    print(f"Buffered pages:    {paged * 1000:.1f} ms for the whole catalog")
+    print(f"First page only:   {first * 1000:.3f} ms")
+
+
+def bench_storage(catalog_size=100_000):
+    # Bulk import time, then startup and one edit on each backend.
+    with tempfile.TemporaryDirectory() as folder:
+        json_path = os.path.join(folder, 'books.json')
+        db_path = os.path.join(folder, 'books.db')
+        with open(json_path, 'w') as file:
+            json.dump(make_books(catalog_size), file)
+
+        start = time.perf_counter()
+        import_json(json_path, db_path)
+        imported = time.perf_counter() - start
+
+        results = {}
+        for name, backend, path in (('JSON', JsonStorage, json_path),
+                                    ('SQLite', SqliteStorage, db_path)):
+            start = time.perf_counter()
+            storage = backend(path)
+            opened = time.perf_counter() - start
+            start = time.perf_counter()
+            book = storage.get(catalog_size // 2)
+            book['borrowed'] = not book['borrowed']
+            storage.update(catalog_size // 2, book)
+            edited = time.perf_counter() - start
+            storage.close()
+            results[name] = (opened, edited)
+
+    print(f"Catalog size: {catalog_size} books")
+    print(f"Bulk import into SQLite: {imported * 1000:.1f} ms")
+    for name, (opened, edited) in results.items():
+        print(f"{name + ':':<8} startup {opened * 1000:8.1f} ms, one edit {edited * 1000:.3f} ms")
+
+
+def bench_memory(catalog_size=1_000_000):
+    # Memory kept after loading the same JSON text: list of dicts (json.load)
+    # vs ColumnarCatalog fed by the streaming reader.
+    text = json.dumps(make_books(catalog_size))
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    books = json.loads(text)
+    dicts = tracemalloc.get_traced_memory()[0] - start
+    last = books[-1]
+    del books
+
+    start = tracemalloc.get_traced_memory()[0]
+    catalog = ColumnarCatalog(iter_json_array(io.StringIO(text)))
+    columns = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    assert dict(catalog[-1]) == last
+
+    print(f"Catalog size: {catalog_size} books")
+    print(f"List of dicts: {dicts / 2**20:7.1f} MiB, {dicts / catalog_size:.1f} bytes per book")
+    print(f"Columnar:      {columns / 2**20:7.1f} MiB, {columns / catalog_size:.1f} bytes per book")
+
+if __name__ == "__main__":
+    bench_save()
+    print()
+    bench_search()
+    print()
+    bench_listing()
+    print()
+    bench_storage()
+    print()
+    bench_memory()
@@ -0,0 +1,231 @@
+import bisect
+import re
+
+
+def tokenize(text):
+    return re.findall(r'\w+', text.lower())
+
+
+def parse_year(year):
+    year = str(year).strip()
+    return int(year) if year.isdigit() else None
+
+
+class BookIndex:
+    """In-memory indexes over the book dicts in the catalog.
+
+    Books are tracked by identity, so positions in the `books` list can
+    shift on delete without touching the indexes. Each indexed book keeps
+    a copy of the values it was indexed under, which lets edits made in
+    place on the dict be unindexed correctly.
+    """
+
+    def __init__(self, books=()):
+        self._books = {}
+        self._indexed = {}
+        # Book id -> sequence number in catalog order, so results can be
+        # listed in the same order as the catalog.
+        self._order = {}
+        self._next_order = 0
+        # Exact-match hash indexes: value -> set of book ids.
+        self._by_title = {}
+        self._by_author = {}
+        self._by_genre = {}
+        self._by_borrowed = {True: set(), False: set()}
+        # Sorted (year, book id) pairs for range queries.
+        self._years = []
+        # Word -> book ids for title/author, plus the sorted distinct words
+        # so prefixes can be found with bisect.
+        self._title_tokens = {}
+        self._author_tokens = {}
+        self._title_words = []
+        self._author_words = []
+        self._build(books)
+
+    def __len__(self):
+        return len(self._books)
+
+    def add(self, book):
+        key = id(book)
+        title = book['title'].lower()
+        author = book['author'].lower()
+        genre = book['genre'].lower()
+        year = parse_year(book['year'])
+        borrowed = bool(book['borrowed'])
+
+        self._books[key] = book
+        self._indexed[key] = (title, author, genre, year, borrowed)
+        self._order[key] = self._next_order
+        self._next_order += 1
+        self._by_title.setdefault(title, set()).add(key)
+        self._by_author.setdefault(author, set()).add(key)
+        self._by_genre.setdefault(genre, set()).add(key)
+        self._by_borrowed[borrowed].add(key)
+        if year is not None:
+            bisect.insort(self._years, (year, key))
+        for word in set(tokenize(title)):
+            self._add_token(self._title_tokens, self._title_words, word, key)
+        for word in set(tokenize(author)):
+            self._add_token(self._author_tokens, self._author_words, word, key)
+
+    def _build(self, books):
+        # Bulk load: fill the hash indexes first and sort the ordered
+        # structures once, instead of one insort per book.
+        for book in books:
+            key = id(book)
+            title = book['title'].lower()
+            author = book['author'].lower()
+            year = parse_year(book['year'])
+            borrowed = bool(book['borrowed'])
+            genre = book['genre'].lower()
+            self._books[key] = book
+            self._indexed[key] = (title, author, genre, year, borrowed)
+            self._order[key] = self._next_order
+            self._next_order += 1
+            self._by_title.setdefault(title, set()).add(key)
+            self._by_author.setdefault(author, set()).add(key)
+            self._by_genre.setdefault(genre, set()).add(key)
+            self._by_borrowed[borrowed].add(key)
+            if year is not None:
+                self._years.append((year, key))
+            for word in tokenize(title):
+                self._title_tokens.setdefault(word, set()).add(key)
+            for word in tokenize(author):
+                self._author_tokens.setdefault(word, set()).add(key)
+        self._years.sort()
+        self._title_words = sorted(self._title_tokens)
+        self._author_words = sorted(self._author_tokens)
+
+    def remove(self, book):
+        key = id(book)
+        title, author, genre, year, borrowed = self._indexed.pop(key)
+        del self._books[key]
+        del self._order[key]
+        self._discard(self._by_title, title, key)
+        self._discard(self._by_author, author, key)
+        self._discard(self._by_genre, genre, key)
+        self._by_borrowed[borrowed].discard(key)
+        if year is not None:
+            position = bisect.bisect_left(self._years, (year, key))
+            del self._years[position]
+        for word in set(tokenize(title)):
+            self._remove_token(self._title_tokens, self._title_words, word, key)
+        for word in set(tokenize(author)):
+            self._remove_token(self._author_tokens, self._author_words, word, key)
+
+    def update(self, book, old=None):
+        """Reindex `book`, keeping its place in the catalog order. Pass
+        the dict it replaces as `old` when `book` is a new dict."""
+        if old is None:
+            old = book
+        order = self._order[id(old)]
+        self.remove(old)
+        self.add(book)
+        self._order[id(book)] = order
+
+    def search(self, title=None, author=None, genre=None,
+               year_from=None, year_to=None, borrowed=None):
+        """Return the books matching every given condition.
+
+        `title` and `author` match word by word, with the last word treated
+        as a prefix ("harry pot" finds "Harry Potter"). `genre` is an exact,
+        case-insensitive match and the year range is inclusive.
+        """
+        candidates = []
+        if title:
+            candidates.append(self._match_words(self._title_tokens, self._title_words, title, 0))
+        if author:
+            candidates.append(self._match_words(self._author_tokens, self._author_words, author, 1))
+        if genre:
+            candidates.append(self._by_genre.get(genre.lower(), set()))
+        if borrowed is not None:
+            candidates.append(self._by_borrowed[bool(borrowed)])
+
+        has_years = year_from is not None or year_to is not None
+        if has_years:
+            low, high = self._year_bounds(year_from, year_to)
+        if not candidates:
+            if not has_years:
+                return self._in_order(self._books)
+            keys = {key for _, key in self._years[low:high]}
+        else:
+            keys = self._intersect_all(candidates)
+            if has_years:
+                if len(keys) <= high - low:
+                    # Cheaper to check the few candidates than to build the range.
+                    keys = {key for key in keys
+                            if self._in_years(self._indexed[key][3], year_from, year_to)}
+                else:
+                    keys &= {key for _, key in self._years[low:high]}
+        return self._in_order(keys)
+
+    def _in_order(self, keys):
+        # Sets iterate in memory-address order; list in catalog order.
+        return [self._books[key] for key in sorted(keys, key=self._order.__getitem__)]
+
+    def find_title(self, title):
+        return [self._books[key] for key in self._by_title.get(title.lower(), ())]
+
+    def find_author(self, author):
+        return [self._books[key] for key in self._by_author.get(author.lower(), ())]
+
+    def _year_bounds(self, year_from, year_to):
+        low = 0 if year_from is None else bisect.bisect_left(self._years, (year_from,))
+        high = (len(self._years) if year_to is None
+                else bisect.bisect_left(self._years, (year_to + 1,)))
+        return low, high
+
+    @staticmethod
+    def _in_years(year, year_from, year_to):
+        return (year is not None
+                and (year_from is None or year >= year_from)
+                and (year_to is None or year <= year_to))
+
+    def _match_words(self, tokens, words, text, field):
+        query = tokenize(text)
+        if not query:
+            return set()
+        # Last word is a prefix: every word in [prefix, prefix + max char).
+        prefix = query[-1]
+        low = bisect.bisect_left(words, prefix)
+        high = bisect.bisect_left(words, prefix + '\uffff')
+        prefixed = [tokens[word] for word in words[low:high]]
+        if len(query) == 1:
+            return set().union(*prefixed)
+
+        keys = self._intersect_all([tokens.get(word, set()) for word in query[:-1]])
+        if len(keys) <= sum(len(found) for found in prefixed):
+            # Few books left: check their words directly instead of
+            # merging every word set that starts with the prefix.
+            return {key for key in keys
+                    if any(word.startswith(prefix)
+                           for word in tokenize(self._indexed[key][field]))}
+        return keys.intersection(set().union(*prefixed))
+
+    @staticmethod
+    def _intersect_all(sets):
+        # Start from the smallest set so no large set is ever copied.
+        sets = sorted(sets, key=len)
+        return sets[0].intersection(*sets[1:])
+
+    @staticmethod
+    def _discard(index, value, key):
+        keys = index[value]
+        keys.discard(key)
+        if not keys:
+            del index[value]
+
+    @staticmethod
+    def _add_token(tokens, words, word, key):
+        if word not in tokens:
+            tokens[word] = set()
+            bisect.insort(words, word)
+        tokens[word].add(key)
+
+    @staticmethod
+    def _remove_token(tokens, words, word, key):
+        keys = tokens[word]
+        keys.discard(key)
+        if not keys:
+            del tokens[word]
+            del words[bisect.bisect_left(words, word)]
@@ -0,0 +1,256 @@
+from array import array
+from collections.abc import MutableMapping
+
+from book_index import parse_year, tokenize
+
+FIELDS = ('title', 'author', 'year', 'genre', 'borrowed')
+# Stored in the year column when parse_year() gives no year that fits in
+# it; range queries then parse the text kept in _year_texts.
+ODD_YEAR = 0xFFFF
+
+
+class BookRow(MutableMapping):
+    """Dict-like view of one row of a ColumnarCatalog.
+
+    The view refers to a position, so it should not be kept across deletes
+    of earlier rows.
+    """
+
+    __slots__ = ('_catalog', '_position')
+
+    def __init__(self, catalog, position):
+        self._catalog = catalog
+        self._position = position
+
+    def __getitem__(self, key):
+        return self._catalog.get_field(self._position, key)
+
+    def __setitem__(self, key, value):
+        self._catalog.set_field(self._position, key, value)
+
+    def __delitem__(self, key):
+        raise TypeError("Book fields cannot be removed")
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class ColumnarCatalog:
+    """Book catalog stored column by column instead of one dict per book.
+
+    Authors and genres are dictionary-encoded into integer codes, years live
+    in an array('H') and the borrowed flags in a bitset, so a book costs a
+    few bytes plus its title. The year column holds parse_year()'s value for
+    range queries; year text that does not read back the same from it (such
+    as "0999" or "c. 1900") is kept as typed in a sparse text column. Indexing returns BookRow views, which lets
+    code written for the list of dicts keep working.
+    """
+
+    def __init__(self, books=()):
+        self._titles = []
+        self._authors = array('I')
+        self._genres = array('I')
+        self._years = array('H')
+        self._borrowed = bytearray()
+        # Row -> year text, only for rows where str(year) differs from it.
+        self._year_texts = {}
+        # Dictionaries for the encoded columns: code -> value, value -> code.
+        self._author_values = []
+        self._author_codes = {}
+        self._genre_values = []
+        self._genre_codes = {}
+        for book in books:
+            self.append(book)
+
+    def __len__(self):
+        return len(self._titles)
+
+    def __getitem__(self, position):
+        return BookRow(self, self._check(position))
+
+    def __setitem__(self, position, book):
+        position = self._check(position)
+        # Read every field first: `book` may be a view of this same row.
+        values = [book[field] for field in FIELDS]
+        for field, value in zip(FIELDS, values):
+            self.set_field(position, field, value)
+
+    def __delitem__(self, position):
+        position = self._check(position)
+        del self._titles[position]
+        del self._authors[position]
+        del self._genres[position]
+        del self._years[position]
+        self._delete_bit(position)
+        if self._year_texts:
+            self._year_texts = {
+                (row - 1 if row > position else row): text
+                for row, text in self._year_texts.items() if row != position
+            }
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield BookRow(self, position)
+
+    def append(self, book):
+        position = len(self)
+        self._titles.append(book['title'])
+        self._authors.append(self._encode(self._author_values, self._author_codes, book['author']))
+        self._genres.append(self._encode(self._genre_values, self._genre_codes, book['genre']))
+        self._years.append(0)
+        if position % 8 == 0:
+            self._borrowed.append(0)
+        self._set_year(position, book['year'])
+        self._set_bit(position, book['borrowed'])
+
+    def copy(self):
+        """Independent copy that shares only the immutable values."""
+        other = ColumnarCatalog()
+        other._titles = self._titles.copy()
+        other._authors = array('I', self._authors)
+        other._genres = array('I', self._genres)
+        other._years = array('H', self._years)
+        other._borrowed = bytearray(self._borrowed)
+        other._year_texts = dict(self._year_texts)
+        other._author_values = self._author_values.copy()
+        other._author_codes = dict(self._author_codes)
+        other._genre_values = self._genre_values.copy()
+        other._genre_codes = dict(self._genre_codes)
+        return other
+
+    def extend(self, books):
+        for book in books:
+            self.append(book)
+
+    def pop(self, position=-1):
+        position = self._check(position)
+        book = dict(BookRow(self, position))
+        del self[position]
+        return book
+
+    def get_field(self, position, key):
+        if key == 'title':
+            return self._titles[position]
+        if key == 'author':
+            return self._author_values[self._authors[position]]
+        if key == 'genre':
+            return self._genre_values[self._genres[position]]
+        if key == 'year':
+            text = self._year_texts.get(position)
+            return str(self._years[position]) if text is None else text
+        if key == 'borrowed':
+            return bool(self._borrowed[position >> 3] & (1 << (position & 7)))
+        raise KeyError(key)
+
+    def set_field(self, position, key, value):
+        if key == 'title':
+            self._titles[position] = value
+        elif key == 'author':
+            self._authors[position] = self._encode(self._author_values, self._author_codes, value)
+        elif key == 'genre':
+            self._genres[position] = self._encode(self._genre_values, self._genre_codes, value)
+        elif key == 'year':
+            self._set_year(position, value)
+        elif key == 'borrowed':
+            self._set_bit(position, value)
+        else:
+            raise KeyError(key)
+
+    def search(self, title=None, author=None, genre=None,
+               year_from=None, year_to=None, borrowed=None):
+        """Scan the columns with the same semantics as BookIndex.search().
+
+        Author and genre conditions are resolved once against the encoded
+        values, so each row only compares integer codes for them.
+        """
+        authors = self._matching_codes(self._author_values, author, words=True)
+        genres = self._matching_codes(self._genre_values, genre, words=False)
+        title_words = tokenize(title) if title else None
+        results = []
+        for position in range(len(self)):
+            if authors is not None and self._authors[position] not in authors:
+                continue
+            if genres is not None and self._genres[position] not in genres:
+                continue
+            if year_from is not None or year_to is not None:
+                year = self._years[position]
+                if year == ODD_YEAR:
+                    year = parse_year(self._year_texts[position])
+                if (year is None
+                        or (year_from is not None and year < year_from)
+                        or (year_to is not None and year > year_to)):
+                    continue
+            if borrowed is not None and self.get_field(position, 'borrowed') != bool(borrowed):
+                continue
+            if title_words is not None and not words_match(title_words, self._titles[position]):
+                continue
+            results.append(BookRow(self, position))
+        return results
+
+    def _check(self, position):
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("book index out of range")
+        return position
+
+    @staticmethod
+    def _encode(values, codes, value):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    @staticmethod
+    def _matching_codes(values, text, words):
+        if not text:
+            return None
+        if not words:
+            text = text.lower()
+            return {code for code, value in enumerate(values) if value.lower() == text}
+        query = tokenize(text)
+        return {code for code, value in enumerate(values) if words_match(query, value)}
+
+    def _set_year(self, position, text):
+        year = parse_year(text)
+        self._year_texts.pop(position, None)
+        if year is not None and year < ODD_YEAR:
+            self._years[position] = year
+            if str(year) != str(text):
+                self._year_texts[position] = text
+        else:
+            self._years[position] = ODD_YEAR
+            self._year_texts[position] = text
+
+    def _set_bit(self, position, value):
+        if value:
+            self._borrowed[position >> 3] |= 1 << (position & 7)
+        else:
+            self._borrowed[position >> 3] &= ~(1 << (position & 7)) & 0xFF
+
+    def _delete_bit(self, position):
+        # Shift every bit after `position` down by one; done on the tail
+        # bytes as one integer so it runs at C speed.
+        start = position >> 3
+        tail = int.from_bytes(self._borrowed[start:], 'little')
+        keep = (1 << (position & 7)) - 1
+        tail = (tail & keep) | ((tail >> 1) & ~keep)
+        self._borrowed[start:] = tail.to_bytes(len(self._borrowed) - start, 'little')
+        if len(self) % 8 == 0:
+            del self._borrowed[-1]
+
+
+def words_match(query, text):
+    # All words present, the last one as a prefix (as in BookIndex.search).
+    if not query:
+        return False
+    words = tokenize(text)
+    return (all(word in words for word in query[:-1])
+            and any(word.startswith(query[-1]) for word in words))
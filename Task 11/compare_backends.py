@@ -0,0 +1,87 @@
+import json
+import os
+import random
+import tempfile
+
+from storage import JsonStorage, SqliteStorage, import_json
+
+# Year text as users type it, including forms only parse_year() reads.
+YEARS = ['1999', '0999', ' 1999', '1999 ', '2001', 'c. 1900', '', '70000', '1950']
+WORDS = ['Catch-22', 'harry', 'Potter', 'J. K. Rowling', 'the', 'THE_end', 'Übel', '22nd']
+
+QUERIES = [
+    {},
+    {'year_from': 999, 'year_to': 1999},
+    {'year_from': 1999, 'year_to': 1999},
+    {'year_from': 1950},
+    {'year_to': 1000},
+    {'year_from': 60000},
+    {'title': '22'},
+    {'title': 'harry pot'},
+    {'author': 'k rowling'},
+    {'genre': 'fiction', 'borrowed': True},
+    {'title': 'the', 'year_from': 1900, 'year_to': 2000},
+]
+
+
+def make_books(count, seed):
+    rng = random.Random(seed)
+    return [{
+        'title': ' '.join(rng.sample(WORDS, 3)),
+        'author': ' '.join(rng.sample(WORDS, 2)),
+        'year': rng.choice(YEARS),
+        'genre': rng.choice(['Fiction', 'History']),
+        'borrowed': rng.random() < 0.5,
+    } for _ in range(count)]
+
+
+def compare(count=500, seed=1):
+    """Run the same searches on every backend over the same catalog,
+    before and after some edits, and check they list the same books in
+    the same order."""
+    books = make_books(count, seed)
+    with tempfile.TemporaryDirectory() as folder:
+        json_path = os.path.join(folder, 'books.json')
+        db_path = os.path.join(folder, 'books.db')
+        with open(json_path, 'w') as file:
+            json.dump(books, file)
+        import_json(json_path, db_path)
+        backends = {
+            'JSON': JsonStorage(json_path),
+            'Columnar': JsonStorage(json_path, columnar=True),
+            'SQLite': SqliteStorage(db_path),
+        }
+
+        mismatches = []
+        for stage in ('loaded', 'edited'):
+            if stage == 'edited':
+                for storage in backends.values():
+                    # Delete last so JSON positions and SQLite ids still agree.
+                    storage.update(3, dict(books[2], year='0999', title='harry 22'))
+                    book = storage.get(5)
+                    book['year'] = ' 1950'
+                    storage.update(5, book)
+                    storage.add(dict(books[0], year='70000'))
+                    storage.delete(count)
+            for query in QUERIES:
+                found = {name: [dict(book) for book in storage.search(**query)]
+                         for name, storage in backends.items()}
+                if not found['JSON'] == found['Columnar'] == found['SQLite']:
+                    mismatches.append((stage, query, {name: len(rows) for name, rows in found.items()}))
+            if stage == 'loaded':
+                matched = len(backends['JSON'].search(year_from=999, year_to=1999))
+
+        for storage in backends.values():
+            storage.close()
+
+    print(f"{count} books, {len(QUERIES)} queries on JSON, Columnar and SQLite, "
+          f"before and after edits")
+    print(f"Books in 999-1999, counting forms like '0999' and ' 1999': {matched}")
+    for stage, query, counts in mismatches:
+        print(f"Mismatch ({stage}) {query}: {counts}")
+    print(f"Same results in the same order on every backend: {not mismatches}")
+    return not mismatches
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if compare() else 1)
@@ -1,16 +1,34 @@
-import json
-import os
+import argparse
+
+from book_index import parse_year
+from listing import show_pages
+from storage import JsonStorage, SqliteStorage, import_json
 
 file_path = 'books.json'
-if os.path.exists(file_path):
-    with open(file_path, 'r') as file:
-        books = json.load(file)
-else:
-    books = []
+db_path = 'books.db'
+
+parser = argparse.ArgumentParser(description="Book catalog manager")
+parser.add_argument('--storage', choices=['json', 'columnar', 'sqlite'], default='json',
+                    help="where the catalog is kept (default: json); columnar keeps "
+                         "books.json in a compact in-memory layout")
+parser.add_argument('--import-json', action='store_true',
+                    help=f"bulk import {file_path} into {db_path} before starting")
+args = parser.parse_args()
+
+if args.import_json:
+    try:
+        print(f"Imported {import_json(file_path, db_path)} books into {db_path}.")
+    except ValueError as e:
+        print(f"Import skipped: {e}")
 
-def save_books():
-    with open(file_path, 'w') as file:
-        json.dump(books, file)
+if args.storage == 'sqlite':
+    storage = SqliteStorage(db_path)
+elif args.storage == 'columnar':
+    storage = JsonStorage(file_path, columnar=True)
+else:
+    # Changes are appended to books.json.journal and folded into books.json
+    # in the background once the journal gets large.
+    storage = JsonStorage(file_path)
 
 def add_book():
     title = input("Enter book title: ")
@@ -26,26 +44,16 @@ def add_book():
         'borrowed': borrowed
     }
     
-    books.append(book)
-    save_books()
-    print(f"Book '{title}' added successfully!")
-    list_books()
+    number = storage.add(book)
+    print(f"Book '{title}' added successfully! Book number: {number}")
     
 def list_books():
-    for index, book in enumerate(books):
-        print("-" * 20)
-        print(f"Number: {index + 1}")
-        print(f"Title: {book['title']}")
-        print(f"Author: {book['author']}")
-        print(f"Year: {book['year']}")
-        print(f"Genre: {book['genre']}")
-        print(f"Borrowed: {'Yes' if book['borrowed'] else 'No'}")
-    print("-" * 20)
+    show_pages(storage.iter_books(), storage.count())
         
 def edit_book():
     list_books()
     no_book = input("Choose book number to edit: ")
-    new_book = books[int(no_book) - 1]
+    new_book = storage.get(int(no_book))
     
     print("Current details:")
     print(f"1. Title: {new_book['title']}")
@@ -68,16 +76,28 @@ def edit_book():
     else:
         print("Invalid choice, no changes made.")
     
-    books[int(no_book) - 1] = new_book
-    save_books()
+    storage.update(int(no_book), new_book)
     print("Book updated successfully!")
     
 def delete_book():
     list_books()
     no_book = input("Choose book number to delete: ")
-    books.pop(int(no_book) - 1)
-    save_books()
+    storage.delete(int(no_book))
     print("Book deleted successfully!")
+
+def search_books():
+    print("Leave a field blank to skip it.")
+    title = input("Title contains: ").strip()
+    author = input("Author contains: ").strip()
+    genre = input("Genre: ").strip()
+    year_from = parse_year(input("Published from year: "))
+    year_to = parse_year(input("Published until year: "))
+    borrowed = input("Borrowed? (yes/no): ").strip().lower()
+    borrowed = {'yes': True, 'no': False}.get(borrowed)
+
+    results = storage.search(title=title, author=author, genre=genre,
+                             year_from=year_from, year_to=year_to, borrowed=borrowed)
+    show_pages(((None, book) for book in results), len(results), numbered=False)
     
 
 while True:
@@ -86,7 +106,8 @@ while True:
     print("2. List Books")
     print("3. Edit Book")
     print("4. Delete Book")
-    print("5. Exit")
+    print("5. Search Books")
+    print("6. Exit")
     
     menu = input("Enter your choice: ")
     if menu == '1':
@@ -98,6 +119,9 @@ while True:
     elif menu == '4':
         delete_book()
     elif menu == '5':
+        search_books()
+    elif menu == '6':
+        storage.close()
         print("Exiting the program.")
         break
     else:
@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+
+
+class BookJournal:
+    """Append-only change journal on top of a books.json snapshot.
+
+    Every add/edit/delete is written as one JSON line, so a single change
+    costs O(1) instead of rewriting the whole catalog. Once the journal
+    grows past `compact_threshold` bytes it is folded into a new snapshot
+    by a background thread.
+    """
+
+    def __init__(self, snapshot_path, compact_threshold=1024 * 1024, container=list):
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + '.journal'
+        # Journal being folded into the snapshot, and the same journal once
+        # the new snapshot is complete on disk (see _write_snapshot).
+        self.compacting_path = snapshot_path + '.journal.compacting'
+        self.compacted_path = snapshot_path + '.journal.compacted'
+        self.tmp_path = snapshot_path + '.tmp'
+        self.compact_threshold = compact_threshold
+        # Called with an iterable of book dicts to build the catalog, e.g.
+        # list or ColumnarCatalog.
+        self.container = container
+        self.books = []
+        self._file = None
+        self._size = 0
+        self._compactor = None
+
+    def load(self):
+        self._recover()
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r') as file:
+                if self.container is list:
+                    self.books = json.load(file)
+                else:
+                    self.books = self.container(iter_json_array(file))
+        else:
+            self.books = self.container()
+
+        # A journal that was being compacted when the program stopped still
+        # has to be replayed before the active one, then folded in again.
+        if os.path.exists(self.compacting_path):
+            self._replay(self.compacting_path)
+            # Nothing edits the books yet, so no copy is needed.
+            self._write_snapshot(self.books)
+        valid = self._replay(self.journal_path)
+
+        self._file = open(self.journal_path, 'a')
+        # Drop a torn last line so new entries start on a clean line.
+        self._file.truncate(valid)
+        self._size = valid
+        return self.books
+
+    def record_add(self, book):
+        self._append({'op': 'add', 'book': book})
+
+    def record_edit(self, index, book):
+        self._append({'op': 'edit', 'index': index, 'book': dict(book)})
+
+    def record_delete(self, index):
+        self._append({'op': 'delete', 'index': index})
+
+    def compact(self, wait=False):
+        if self._compactor is not None and self._compactor.is_alive():
+            if wait:
+                self._compactor.join()
+            return
+        # Copy the rows now: the menu edits book dicts in place while the
+        # background thread is still writing the snapshot. A columnar
+        # catalog copies its column arrays instead of building dicts.
+        if self.container is list:
+            snapshot = [dict(book) for book in self.books]
+        else:
+            snapshot = self.books.copy()
+        self._file.close()
+        os.replace(self.journal_path, self.compacting_path)
+        self._file = open(self.journal_path, 'a')
+        self._size = 0
+        self._compactor = threading.Thread(target=self._write_snapshot, args=(snapshot,))
+        self._compactor.start()
+        if wait:
+            self._compactor.join()
+
+    def close(self):
+        if self._compactor is not None:
+            self._compactor.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _append(self, entry):
+        line = json.dumps(entry) + '\n'
+        self._file.write(line)
+        self._file.flush()
+        self._size += len(line)
+        if self._size >= self.compact_threshold:
+            self.compact()
+
+    def _apply(self, entry):
+        op = entry['op']
+        if op == 'add':
+            self.books.append(entry['book'])
+        elif op == 'edit':
+            self.books[entry['index']] = entry['book']
+        elif op == 'delete':
+            self.books.pop(entry['index'])
+
+    def _replay(self, path):
+        # Returns the size in bytes of the journal's valid prefix.
+        valid = 0
+        if not os.path.exists(path):
+            return valid
+        with open(path, 'rb') as file:
+            for line in file:
+                if not line.endswith(b'\n'):
+                    # Torn last line from an interrupted write.
+                    break
+                self._apply(json.loads(line))
+                valid += len(line)
+        return valid
+
+    def _write_snapshot(self, snapshot):
+        with open(self.tmp_path, 'w') as file:
+            if isinstance(snapshot, list):
+                json.dump(snapshot, file)
+            else:
+                write_json_array(file, snapshot)
+            file.flush()
+            os.fsync(file.fileno())
+        # Renaming the journal first marks the snapshot in tmp_path as
+        # complete, so _recover() can finish the swap after a crash.
+        os.replace(self.compacting_path, self.compacted_path)
+        os.replace(self.tmp_path, self.snapshot_path)
+        os.remove(self.compacted_path)
+
+    def _recover(self):
+        if os.path.exists(self.compacted_path):
+            if os.path.exists(self.tmp_path):
+                os.replace(self.tmp_path, self.snapshot_path)
+            os.remove(self.compacted_path)
+        elif os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def write_json_array(file, books):
+    """Write books as a JSON array, one book at a time."""
+    file.write('[')
+    for position, book in enumerate(books):
+        if position:
+            file.write(', ')
+        file.write(json.dumps(dict(book)))
+    file.write(']')
+
+
+def iter_json_array(file, chunk_size=1024 * 1024):
+    """Yield the items of a top-level JSON array without loading the file."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    started = False
+    eof = False
+    while True:
+        # Skip whitespace, separators and the opening bracket.
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+        if position < len(buffer) and not started:
+            if buffer[position] != '[':
+                raise ValueError("Expected a JSON array")
+            started = True
+            position += 1
+            continue
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        if position < len(buffer):
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except ValueError:
+                if eof:
+                    raise
+            else:
+                # An item is only complete once a delimiter follows it: a
+                # number such as 1e5 may be cut at the end of the chunk.
+                if (end < len(buffer) and buffer[end] in ' \t\r\n,]') or eof:
+                    position = end
+                    yield item
+                    continue
+        if eof:
+            return
+        chunk = file.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
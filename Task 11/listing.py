@@ -0,0 +1,46 @@
+import itertools
+import sys
+
+PAGE_SIZE = 20
+
+
+def format_book(book):
+    return (f"{book['title']} | {book['author']} | {book['year']} | {book['genre']} | "
+            f"{'Borrowed' if book['borrowed'] else 'Available'}")
+
+
+def iter_pages(rows, page_size=PAGE_SIZE):
+    # Lazily chunks (number, book) rows; the catalog is never copied.
+    rows = iter(rows)
+    while True:
+        page = list(itertools.islice(rows, page_size))
+        if not page:
+            return
+        yield page
+
+
+def render_page(page, numbered=True):
+    if numbered:
+        return ''.join(f"{number:>6}. {format_book(book)}\n" for number, book in page)
+    return ''.join(f"  - {format_book(book)}\n" for _, book in page)
+
+
+def show_pages(rows, total, page_size=PAGE_SIZE, numbered=True, pause=True, out=None):
+    """Print (number, book) `rows` one page at a time, one buffered write
+    per page.
+
+    With `pause` the user is asked before each following page and can stop
+    early, so a large catalog is only read and formatted as far as it is
+    shown.
+    """
+    out = out or sys.stdout
+    if not total:
+        out.write("No books found.\n")
+        return
+    pages = (total + page_size - 1) // page_size
+    for page_no, page in enumerate(iter_pages(rows, page_size), start=1):
+        out.write(render_page(page, numbered) + f"-- Page {page_no}/{pages} ({total} books) --\n")
+        out.flush()
+        if pause and page_no < pages:
+            if input("Press Enter for the next page or 'q' to stop: ").lower() == 'q':
+                break
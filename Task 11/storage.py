@@ -0,0 +1,283 @@
+import os
+import sqlite3
+
+from book_index import BookIndex, parse_year, tokenize
+from columnar import ColumnarCatalog
+from journal import BookJournal, iter_json_array
+
+
+class JsonStorage:
+    """Default backend: books.json plus its change journal, held in memory.
+
+    Book numbers are positions in the catalog, starting at 1. With
+    `columnar` the books are kept in a ColumnarCatalog and searched by
+    scanning its columns, trading search speed for a much smaller footprint.
+    """
+
+    def __init__(self, file_path='books.json', columnar=False):
+        if columnar:
+            self.journal = BookJournal(file_path, container=ColumnarCatalog)
+            self.books = self.journal.load()
+            self.index = None
+        else:
+            self.journal = BookJournal(file_path)
+            self.books = self.journal.load()
+            self.index = BookIndex(self.books)
+
+    def count(self):
+        return len(self.books)
+
+    def iter_books(self):
+        return enumerate(self.books, start=1)
+
+    def get(self, number):
+        return self.books[number - 1]
+
+    def add(self, book):
+        self.books.append(book)
+        self.journal.record_add(book)
+        if self.index is not None:
+            self.index.add(book)
+        return len(self.books)
+
+    def update(self, number, book):
+        # `book` may be the stored dict edited in place or a new one, so
+        # the index is told which dict it replaces.
+        old = self.books[number - 1]
+        self.books[number - 1] = book
+        self.journal.record_edit(number - 1, book)
+        if self.index is not None:
+            self.index.update(book, old)
+
+    def delete(self, number):
+        book = self.books.pop(number - 1)
+        self.journal.record_delete(number - 1)
+        if self.index is not None:
+            self.index.remove(book)
+        return book
+
+    def search(self, **criteria):
+        if self.index is None:
+            return self.books.search(**criteria)
+        return self.index.search(**criteria)
+
+    def close(self):
+        self.journal.close()
+
+
+class SqliteStorage:
+    """SQLite backend: nothing is loaded up front and every change runs in
+    its own transaction.
+
+    Book numbers are the rows' stable ids, so they do not shift on delete.
+    """
+
+    COLUMNS = 'id, title, author, year, genre, borrowed'
+
+    def __init__(self, db_path='books.db'):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        create_schema(self.conn)
+
+    def count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM books').fetchone()[0]
+
+    def iter_books(self):
+        # The cursor is read lazily, page by page, as the listing advances.
+        cursor = self.conn.execute(f'SELECT {self.COLUMNS} FROM books ORDER BY id')
+        return ((row[0], row_to_book(row)) for row in cursor)
+
+    def get(self, number):
+        row = self.conn.execute(f'SELECT {self.COLUMNS} FROM books WHERE id = ?',
+                                (number,)).fetchone()
+        if row is None:
+            raise IndexError(f"No book with number {number}")
+        return row_to_book(row)
+
+    def add(self, book):
+        with self.conn:
+            cursor = self.conn.execute(
+                'INSERT INTO books (title, author, year, year_num, genre, borrowed) '
+                'VALUES (?, ?, ?, ?, ?, ?)', book_to_row(book))
+            self.conn.executemany(INSERT_WORD, book_words(cursor.lastrowid, book))
+        return cursor.lastrowid
+
+    def update(self, number, book):
+        with self.conn:
+            cursor = self.conn.execute(
+                'UPDATE books SET title = ?, author = ?, year = ?, year_num = ?, '
+                'genre = ?, borrowed = ? WHERE id = ?', book_to_row(book) + (number,))
+            if cursor.rowcount == 0:
+                raise IndexError(f"No book with number {number}")
+            self.conn.execute('DELETE FROM book_words WHERE book_id = ?', (number,))
+            self.conn.executemany(INSERT_WORD, book_words(number, book))
+
+    def delete(self, number):
+        with self.conn:
+            book = self.get(number)
+            self.conn.execute('DELETE FROM books WHERE id = ?', (number,))
+            self.conn.execute('DELETE FROM book_words WHERE book_id = ?', (number,))
+        return book
+
+    def search(self, title=None, author=None, genre=None,
+               year_from=None, year_to=None, borrowed=None):
+        # Same semantics as BookIndex.search(): exact genre, inclusive year
+        # range, and title/author words where the last word is a prefix.
+        # Words come from the book_words table, split by the same tokenize().
+        clauses = []
+        params = []
+        for field, text in ((TITLE, title), (AUTHOR, author)):
+            if not text:
+                continue
+            words = tokenize(text)
+            if not words:
+                # Nothing to match, as in BookIndex.
+                return []
+            for word in words[:-1]:
+                clauses.append('id IN (SELECT book_id FROM book_words '
+                               'WHERE field = ? AND word = ?)')
+                params += [field, word]
+            clauses.append('id IN (SELECT book_id FROM book_words '
+                           'WHERE field = ? AND word >= ? AND word < ?)')
+            params += [field, words[-1], words[-1] + '\uffff']
+        if genre:
+            clauses.append('genre = ? COLLATE NOCASE')
+            params.append(genre)
+        if year_from is not None:
+            clauses.append('year_num >= ?')
+            params.append(year_from)
+        if year_to is not None:
+            clauses.append('year_num <= ?')
+            params.append(year_to)
+        if borrowed is not None:
+            clauses.append('borrowed = ?')
+            params.append(int(bool(borrowed)))
+
+        query = f'SELECT {self.COLUMNS} FROM books'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        return [row_to_book(row) for row in self.conn.execute(query + ' ORDER BY id', params)]
+
+    def close(self):
+        self.conn.close()
+
+
+# book_words.field values
+TITLE = 0
+AUTHOR = 1
+
+INSERT_WORD = 'INSERT INTO book_words (field, word, book_id) VALUES (?, ?, ?)'
+
+
+def create_schema(conn, indexes=True):
+    has_words = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'book_words'").fetchone()
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS books (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            year TEXT NOT NULL,
+            year_num INTEGER,
+            genre TEXT NOT NULL,
+            borrowed INTEGER NOT NULL
+        )''')
+    # Title and author words as tokenize() splits them, for word and
+    # prefix searches through the book_words_word index.
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS book_words (
+            field INTEGER NOT NULL,
+            word TEXT NOT NULL,
+            book_id INTEGER NOT NULL
+        )''')
+    if not has_words:
+        # A database from before the word table: fill it in once.
+        rows = conn.execute('SELECT id, title, author FROM books').fetchall()
+        for book_id, title, author in rows:
+            conn.executemany(INSERT_WORD, book_words(book_id, {'title': title, 'author': author}))
+    if indexes:
+        conn.execute('CREATE INDEX IF NOT EXISTS books_title ON books (title COLLATE NOCASE)')
+        conn.execute('CREATE INDEX IF NOT EXISTS books_author ON books (author COLLATE NOCASE)')
+        conn.execute('CREATE INDEX IF NOT EXISTS books_genre ON books (genre COLLATE NOCASE)')
+        conn.execute('CREATE INDEX IF NOT EXISTS books_year ON books (year_num)')
+        conn.execute('CREATE INDEX IF NOT EXISTS books_borrowed ON books (borrowed)')
+        conn.execute('CREATE INDEX IF NOT EXISTS book_words_word ON book_words (field, word, book_id)')
+        conn.execute('CREATE INDEX IF NOT EXISTS book_words_book ON book_words (book_id)')
+    conn.commit()
+
+
+def book_to_row(book):
+    # year stays text as typed; year_num is the indexed copy for ranges.
+    return (book['title'], book['author'], book['year'], parse_year(book['year']),
+            book['genre'], int(bool(book['borrowed'])))
+
+
+def book_words(book_id, book):
+    return ([(TITLE, word, book_id) for word in set(tokenize(book['title']))]
+            + [(AUTHOR, word, book_id) for word in set(tokenize(book['author']))])
+
+
+def row_to_book(row):
+    return {
+        'title': row[1],
+        'author': row[2],
+        'year': row[3],
+        'genre': row[4],
+        'borrowed': bool(row[5])
+    }
+
+
+def insert_batches(conn, books, batch_size):
+    insert = ('INSERT INTO books (id, title, author, year, year_num, genre, borrowed) '
+              'VALUES (?, ?, ?, ?, ?, ?, ?)')
+    # Ids are assigned here so each book's words go in the same batch.
+    next_id = conn.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM books').fetchone()[0]
+    total = 0
+    batch = []
+    words = []
+    for book in books:
+        batch.append((next_id + total + len(batch),) + book_to_row(book))
+        words += book_words(batch[-1][0], book)
+        if len(batch) == batch_size:
+            with conn:
+                conn.executemany(insert, batch)
+                conn.executemany(INSERT_WORD, words)
+            total += len(batch)
+            batch = []
+            words = []
+    if batch:
+        with conn:
+            conn.executemany(insert, batch)
+            conn.executemany(INSERT_WORD, words)
+        total += len(batch)
+    return total
+
+
+def import_json(json_path='books.json', db_path='books.db', batch_size=10_000):
+    """Stream books.json into SQLite in batched inserts; returns the count.
+
+    A pending change journal is replayed first so the import matches what
+    the JSON backend would show; in that case the catalog is loaded once.
+    Raises ValueError if the database already has books, since importing
+    again would add every book a second time.
+    """
+    conn = sqlite3.connect(db_path)
+    # Indexes are built once at the end instead of on every insert.
+    create_schema(conn, indexes=False)
+    existing = conn.execute('SELECT COUNT(*) FROM books').fetchone()[0]
+    if existing:
+        conn.close()
+        raise ValueError(f"{db_path} already has {existing} books; "
+                         f"remove it to import {json_path} again")
+    has_journal = any(os.path.exists(json_path + suffix)
+                      for suffix in ('.journal', '.journal.compacting', '.journal.compacted'))
+    if has_journal:
+        journal = BookJournal(json_path)
+        total = insert_batches(conn, journal.load(), batch_size)
+        journal.close()
+    else:
+        with open(json_path, 'r') as file:
+            total = insert_batches(conn, iter_json_array(file), batch_size)
+    create_schema(conn)
+    conn.close()
+    return total
@@ -1,8 +1,14 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from account_registry import AccountRegistry
+
 class BankAccount:
-    def __init__(self, ownerName, balance=0):
+    def __init__(self, ownerName, accountNumber, balance=0):
         self.ownerName = ownerName
         self.balance = balance
-        self.accountNumber = len(accounts) + 1
+        self.accountNumber = accountNumber
         
     def deposit(self, amount):
         self.balance += amount
@@ -18,73 +24,97 @@ class BankAccount:
     def check_balance(self):
         print(f"Account Balance for {self.ownerName}: ${self.balance}")
         
-accounts = []
+accounts = AccountRegistry()
 
-while True:
-    print("\nBank Account Menu:")
-    print("1. Create Account")
-    print("2. List Accounts")
-    print("3. Deposit")
-    print("4. Withdraw")
-    print("5. Check Balance")
-    print("6. Exit")
-    
-    menu = input("Select an option: ")
+if __name__ == "__main__":
+    while True:
+        print("\nBank Account Menu:")
+        print("1. Create Account")
+        print("2. List Accounts")
+        print("3. Deposit")
+        print("4. Withdraw")
+        print("5. Check Balance")
+        print("6. Find Accounts by Owner")
+        print("7. Apply Transaction File")
+        print("8. Exit")
     
-    if menu == "1":
-        try:
-            ownerName = input("Enter account owner name: ")
-            balance = float(input("Enter initial balance: "))
-            account = BankAccount(ownerName, balance)
-            accounts.append(account)
-            print(f"Account created successfully. Account Number: {account.accountNumber}")
-        except ValueError:
-            print("Invalid input. Please enter a valid number for the balance.")
+        menu = input("Select an option: ")
     
-    elif menu == "2":
-        if accounts:
-            for account in accounts:
-                print(f"Account Number: {account.accountNumber}, Owner: {account.ownerName}")
-        else:
-            print("No accounts found.")
+        if menu == "1":
+            try:
+                ownerName = input("Enter account owner name: ")
+                balance = float(input("Enter initial balance: "))
+                account = BankAccount(ownerName, accounts.next_number(), balance)
+                accounts.add(account.accountNumber, account, owner=ownerName)
+                print(f"Account created successfully. Account Number: {account.accountNumber}")
+            except ValueError:
+                print("Invalid input. Please enter a valid number for the balance.")
     
-    elif menu == "3":
-        try:
-            account_number = int(input("Enter account number: "))
-            account = next((acc for acc in accounts if acc.accountNumber == account_number), None)
-            if account:
-                amount = float(input("Enter deposit amount: "))
-                account.deposit(amount)
+        elif menu == "2":
+            if accounts:
+                for account in accounts:
+                    print(f"Account Number: {account.accountNumber}, Owner: {account.ownerName}")
             else:
-                print("Account not found.")
-        except ValueError:
-            print("Invalid input. Please enter a valid number for the account number and deposit amount.")
+                print("No accounts found.")
     
-    elif menu == "4":
-        try:
-            account_number = int(input("Enter account number: "))
-            account = next((acc for acc in accounts if acc.accountNumber == account_number), None)
-            if account:
-                amount = float(input("Enter withdrawal amount: "))
-                account.withdraw(amount)
-            else:
-                print("Account not found.")
-        except ValueError:
-            print("Invalid input. Please enter a valid number for the account number and withdrawal amount.")
+        elif menu == "3":
+            try:
+                account_number = int(input("Enter account number: "))
+                account = accounts.get(account_number)
+                if account:
+                    amount = float(input("Enter deposit amount: "))
+                    account.deposit(amount)
+                else:
+                    print("Account not found.")
+            except ValueError:
+                print("Invalid input. Please enter a valid number for the account number and deposit amount.")
     
-    elif menu == "5":
-        try:
-            account_number = int(input("Enter account number: "))
-            account = next((acc for acc in accounts if acc.accountNumber == account_number), None)
-            if account:
-                account.check_balance()
+        elif menu == "4":
+            try:
+                account_number = int(input("Enter account number: "))
+                account = accounts.get(account_number)
+                if account:
+                    amount = float(input("Enter withdrawal amount: "))
+                    account.withdraw(amount)
+                else:
+                    print("Account not found.")
+            except ValueError:
+                print("Invalid input. Please enter a valid number for the account number and withdrawal amount.")
+    
+        elif menu == "5":
+            try:
+                account_number = int(input("Enter account number: "))
+                account = accounts.get(account_number)
+                if account:
+                    account.check_balance()
+                else:
+                    print("Account not found.")
+            except ValueError:
+                print("Invalid input. Please enter a valid number for the account number.")
+    
+        elif menu == "6":
+            ownerName = input("Enter account owner name: ")
+            owned = accounts.find_by_owner(ownerName)
+            if owned:
+                for account in owned:
+                    print(f"Account Number: {account.accountNumber}, Balance: ${account.balance}")
             else:
-                print("Account not found.")
-        except ValueError:
-            print("Invalid input. Please enter a valid number for the account number.")
+                print("No accounts found.")
     
-    elif menu == "6":
-        break
+        elif menu == "7":
+            # NumPy is only needed for batch replays.
+            from batch_engine import BatchLedger
+            path = input("Enter transaction file (account,type,amount): ")
+            try:
+                ledger = BatchLedger.from_accounts(accounts)
+                result = ledger.apply_file(path)
+                ledger.sync_to(accounts)
+                print(result.summary())
+            except (OSError, ValueError) as e:
+                print(f"Could not apply transaction file: {e}")
+        
+        elif menu == "8":
+            break
     
-    else:
-        print("Invalid option. Please try again.")
\ No newline at end of file
+        else:
+            print("Invalid option. Please try again.")
\ No newline at end of file
@@ -1,3 +1,7 @@
+from itertools import islice
+
+from reservations import PRIORITY, STANDARD, Waitlists
+
 class Book:
     def __init__(self, title, author, ISBN, available=True):
         self.title = title
@@ -9,17 +13,103 @@ class Book:
         if self.available:
             self.available = False
             print(f"{self.title} by {self.author} has been borrowed.")
-        else:
-            print(f"{self.title} by {self.author} is not available.")
+            return True
+        print(f"{self.title} by {self.author} is not available.")
+        return False
 
     def returnbook(self):
         if not self.available:
             self.available = True
             print(f"{self.title} by {self.author} has been returned.")
+            return True
+        print(f"{self.title} by {self.author} is already available.")
+        return False
+
+
+class Library:
+    """Books indexed by ISBN, with the ISBNs of available books in a set.
+
+    Borrow and return by ISBN through the library, which keeps the set,
+    the borrowed list and each Book's `available` flag in step, all in
+    O(1) however large the catalog is.
+
+    Members can reserve a book that is out. When it comes back it goes
+    straight to the first member in its waitlist instead of the shelf.
+    """
+
+    def __init__(self, books=()):
+        self.books = {}
+        self.available = set()
+        # ISBN -> Book, in the order they were borrowed.
+        self.borrowed = {}
+        # ISBN -> member, for books handed to a member from a waitlist.
+        self.borrowers = {}
+        self.waitlists = Waitlists()
+        for book in books:
+            self.add(book)
+
+    def __len__(self):
+        return len(self.books)
+
+    def __contains__(self, ISBN):
+        return ISBN in self.books
+
+    def add(self, book):
+        if book.ISBN in self.books:
+            raise ValueError(f"A book with ISBN {book.ISBN} is already in the library.")
+        self.books[book.ISBN] = book
+        if book.available:
+            self.available.add(book.ISBN)
         else:
-            print(f"{self.title} by {self.author} is already available.")
-            
-books = [
+            self.borrowed[book.ISBN] = book
+
+    def get(self, ISBN):
+        return self.books.get(ISBN)
+
+    def is_available(self, ISBN):
+        return ISBN in self.available
+
+    def borrow(self, ISBN):
+        """Borrow a book; returns the Book, or None if the ISBN is unknown."""
+        book = self.books.get(ISBN)
+        if book is not None and book.borrowbook():
+            self.available.discard(ISBN)
+            self.borrowed[ISBN] = book
+        return book
+
+    def return_book(self, ISBN):
+        book = self.books.get(ISBN)
+        if book is not None and book.returnbook():
+            self.borrowed.pop(ISBN, None)
+            self.borrowers.pop(ISBN, None)
+            member = self.waitlists.next_member(ISBN)
+            if member is None:
+                self.available.add(ISBN)
+            else:
+                book.borrowbook()
+                self.borrowed[ISBN] = book
+                self.borrowers[ISBN] = member
+        return book
+
+    def reserve(self, ISBN, member, tier=STANDARD):
+        """Join the waitlist for a borrowed book. Returns False if the book
+        is unknown or on the shelf, or the member is already waiting."""
+        if ISBN not in self.books or ISBN in self.available:
+            return False
+        return self.waitlists.reserve(ISBN, member, tier)
+
+    def cancel_reservation(self, ISBN, member):
+        return self.waitlists.cancel(ISBN, member)
+
+    def iter_available(self):
+        """Available books in catalog order."""
+        return (book for ISBN, book in self.books.items() if ISBN in self.available)
+
+
+# Books listed per page in the menu.
+PAGE_SIZE = 20
+
+library = Library([
     Book("1984", "George Orwell", "978-0-452-28423-4"),
     Book("To Kill a Mockingbird", "Harper Lee", "978-0-06-112008-4"),
     Book("Pride and Prejudice", "Jane Austen", "978-0-14-143951-8"),
@@ -27,52 +117,78 @@ books = [
     Book("Moby-Dick", "Herman Melville", "978-0-14-243724-7"),
     Book("The Great Gatsby", "F. Scott Fitzgerald", "978-0-7432-7356-5"),
     Book("Brave New World", "Aldous Huxley", "978-0-06-085052-4"),
-]
-
-borrowed_books = []
-
-while True:
-    print("\nLibrary Menu:")
-    print("1. Borrow Book")
-    print("2. Return Book")
-    print("3. Exit")
-    
-    menu = input("Select an option: ")
-    
-    if menu == "1":
-        try:
-            for i, book in enumerate(books):
-                print(f"{i+1}. {book.title} by {book.author}")
-            book_index = int(input("Enter book number: ")) - 1
-            if 0 <= book_index < len(books):
-                if books[book_index] in borrowed_books:
-                    print("Book is already borrowed.")
-                    continue
-                books[book_index].borrowbook()
-                borrowed_books.append(books[book_index])
+])
+
+if __name__ == "__main__":
+    while True:
+        print("\nLibrary Menu:")
+        print("1. List Available Books")
+        print("2. Borrow Book")
+        print("3. Return Book")
+        print("4. Reserve Book")
+        print("5. Cancel Reservation")
+        print("6. Exit")
+        
+        menu = input("Select an option: ")
+        
+        if menu == "1":
+            if library.available:
+                for book in islice(library.iter_available(), PAGE_SIZE):
+                    print(f"{book.ISBN} | {book.title} by {book.author}")
+                if len(library.available) > PAGE_SIZE:
+                    print(f"... and {len(library.available) - PAGE_SIZE} more.")
             else:
-                print("Invalid book number.")
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
-    
-    elif menu == "2":
-        try:
-            if borrowed_books:
-                for i, book in enumerate(borrowed_books):
-                    print(f"{i+1}. {book.title} by {book.author}")
-                book_index = int(input("Enter book number: ")) - 1
-                if 0 <= book_index < len(borrowed_books):
-                    borrowed_books[book_index].returnbook()
-                    borrowed_books.remove(borrowed_books[book_index])
+                print("No books available.")
+        
+        elif menu == "2":
+            ISBN = input("Enter ISBN: ").strip()
+            if ISBN not in library:
+                print("Book not found.")
+            elif not library.is_available(ISBN):
+                print("Book is already borrowed.")
+            else:
+                library.borrow(ISBN)
+        
+        elif menu == "3":
+            if library.borrowed:
+                for book in islice(library.borrowed.values(), PAGE_SIZE):
+                    print(f"{book.ISBN} | {book.title} by {book.author}")
+                if len(library.borrowed) > PAGE_SIZE:
+                    print(f"... and {len(library.borrowed) - PAGE_SIZE} more.")
+                ISBN = input("Enter ISBN: ").strip()
+                if ISBN in library.borrowed:
+                    library.return_book(ISBN)
+                    if ISBN in library.borrowers:
+                        print(f"Handed over to {library.borrowers[ISBN]}, first on the waitlist.")
                 else:
-                    print("Invalid book number.")
+                    print("That book is not borrowed.")
             else:
                 print("No borrowed books found.")
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
-    
-    elif menu == "3":
-        break
-    
-    else:
-        print("Invalid option. Please select a valid option.")
+        
+        elif menu == "4":
+            ISBN = input("Enter ISBN: ").strip()
+            if ISBN not in library:
+                print("Book not found.")
+            elif library.is_available(ISBN):
+                print("Book is available; borrow it instead.")
+            else:
+                member = input("Enter member name: ").strip()
+                priority = input("Priority member? (y/n): ").strip().lower() == "y"
+                if library.reserve(ISBN, member, PRIORITY if priority else STANDARD):
+                    print(f"Reserved. Members waiting: {library.waitlists.waiting(ISBN)}")
+                else:
+                    print("You already have a reservation for this book.")
+        
+        elif menu == "5":
+            ISBN = input("Enter ISBN: ").strip()
+            member = input("Enter member name: ").strip()
+            if library.cancel_reservation(ISBN, member):
+                print("Reservation cancelled.")
+            else:
+                print("No reservation found.")
+        
+        elif menu == "6":
+            break
+        
+        else:
+            print("Invalid option. Please select a valid option.")
\ No newline at end of file
@@ -15,56 +15,139 @@ class CartItem:
         total = self.price * self.quantity
         return total
 
-cart_items = []
-
-while True:
-    print("\nShopping Cart Menu:")
-    print("1. Add Item")
-    print("2. Remove Item")
-    print("3. Calculate Total")
-    print("4. Exit")
-    
-    menu = input("Select an option: ")
-    
-    if menu == "1":
-        try:
-            item_name = input("Enter item name: ")
-            price = float(input("Enter price: "))
-            quantity = int(input("Enter quantity: "))
-            item = CartItem(item_name, price, quantity)
-            cart_items.append(item)
-            print(f"{item.item_name} added to cart.")
-        except ValueError:
-            print("Invalid input. Please enter a valid number for the price and quantity.")
-    
-    elif menu == "2":
-        try:
-            if cart_items:
-                for i, item in enumerate(cart_items):
-                    print(f"{i+1}. {item.item_name} - Quantity: {item.quantity}")
-                item_index = int(input("Enter item number to remove: ")) - 1
-                if 0 <= item_index < len(cart_items):
-                    cart_items[item_index].removeitem()
-                    cart_items.pop(item_index)
+class Cart:
+    """Cart items keyed by item name.
+
+    Adding an item that is already in the cart merges the quantities.
+    The subtotal is kept in integer cents and adjusted on every change, so
+    reading it never re-sums the cart and repeated changes cannot drift.
+    Change quantities through the cart, not on the CartItem directly.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self._subtotal_cents = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items.values())
+
+    def __contains__(self, item_name):
+        return item_name in self.items
+
+    @property
+    def subtotal(self):
+        return self._subtotal_cents / 100
+
+    def get(self, item_name):
+        return self.items.get(item_name)
+
+    def add(self, item_name, price, quantity=1):
+        if quantity < 1:
+            raise ValueError("Quantity must be at least 1.")
+        item = self.items.get(item_name)
+        if item is None:
+            item = self.items[item_name] = CartItem(item_name, price, 0)
+        else:
+            self._subtotal_cents -= self._line_cents(item)
+        # The latest price applies to the whole line.
+        item.price = price
+        item.quantity += quantity
+        self._subtotal_cents += self._line_cents(item)
+        return item
+
+    def update(self, item_name, quantity):
+        """Set an item's quantity; 0 removes it. Returns the item, or None
+        if it is not in the cart."""
+        if quantity < 0:
+            raise ValueError("Quantity cannot be negative.")
+        item = self.items.get(item_name)
+        if item is None:
+            return None
+        if quantity == 0:
+            return self.remove(item_name)
+        self._subtotal_cents -= self._line_cents(item)
+        item.quantity = quantity
+        self._subtotal_cents += self._line_cents(item)
+        return item
+
+    def remove(self, item_name):
+        item = self.items.pop(item_name, None)
+        if item is not None:
+            self._subtotal_cents -= self._line_cents(item)
+        return item
+
+    @staticmethod
+    def _line_cents(item):
+        return round(item.price * 100) * item.quantity
+
+cart = Cart()
+
+if __name__ == "__main__":
+    while True:
+        print("\nShopping Cart Menu:")
+        print("1. Add Item")
+        print("2. Remove Item")
+        print("3. Update Quantity")
+        print("4. Calculate Total")
+        print("5. Exit")
+        
+        menu = input("Select an option: ")
+        
+        if menu == "1":
+            try:
+                item_name = input("Enter item name: ")
+                price = float(input("Enter price: "))
+                quantity = int(input("Enter quantity: "))
+                merged = item_name in cart
+                item = cart.add(item_name, price, quantity)
+                if merged:
+                    print(f"{item.item_name} added to cart. Quantity: {item.quantity}")
+                else:
+                    print(f"{item.item_name} added to cart.")
+            except ValueError:
+                print("Invalid input. Please enter a valid number for the price and quantity.")
+        
+        elif menu == "2":
+            if cart:
+                for item in cart:
+                    print(f"{item.item_name} - Quantity: {item.quantity}")
+                item = cart.remove(input("Enter item name to remove: "))
+                if item:
+                    item.removeitem()
+                else:
+                    print("Item not found in cart.")
+            else:
+                print("No items in cart.")
+        
+        elif menu == "3":
+            try:
+                item_name = input("Enter item name: ")
+                if item_name in cart:
+                    quantity = int(input("Enter new quantity (0 removes the item): "))
+                    item = cart.update(item_name, quantity)
+                    if quantity:
+                        print(f"{item.item_name} quantity updated. Quantity: {item.quantity}")
+                    else:
+                        item.removeitem()
                 else:
-                    print("Invalid item number.")
+                    print("Item not found in cart.")
+            except ValueError:
+                print("Invalid input. Please enter a valid quantity.")
+        
+        elif menu == "4":
+            if cart:
+                print("Items in cart:")
+                for item in cart:
+                    print(f"{item.item_name} - Quantity: {item.quantity} - Total: ${item.calculate_total()}")
+                print(f"Total Price for all items: ${cart.subtotal}")
             else:
                 print("No items in cart.")
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
-    
-    elif menu == "3":
-        if cart_items:
-            print("Items in cart:")
-            for item in cart_items:
-                print(f"{item.item_name} - Quantity: {item.quantity} - Total: ${item.calculate_total()}")
-            total = sum(item.calculate_total() for item in cart_items)
-            print(f"Total Price for all items: ${total}")
+        
+        elif menu == "5":
+            break
+        
         else:
-            print("No items in cart.")
-    
-    elif menu == "4":
-        break
-    
-    else:
-        print("Invalid option. Please select a valid option.")
\ No newline at end of file
+            print("Invalid option. Please select a valid option.")
\ No newline at end of file
@@ -0,0 +1,205 @@
+import csv
+
+import numpy as np
+
+DEPOSIT = 0
+WITHDRAW = 1
+TRANSACTION_TYPES = {'deposit': DEPOSIT, 'withdraw': WITHDRAW}
+
+# Rejection reasons reported in BatchResult.reasons.
+INSUFFICIENT_BALANCE = 'Insufficient Balance'
+ACCOUNT_NOT_FOUND = 'Account not found'
+
+
+class BatchResult:
+    def __init__(self, applied, rows, accounts, amounts, reasons):
+        self.applied = applied
+        # Rejected transactions: row numbers in the batch (0-based), their
+        # account numbers, amounts in dollars and the reason for each.
+        self.rows = rows
+        self.accounts = accounts
+        self.amounts = amounts
+        self.reasons = reasons
+
+    @property
+    def rejected(self):
+        return len(self.rows)
+
+    def summary(self, limit=10):
+        lines = [f"Applied {self.applied} transaction(s), rejected {self.rejected}."]
+        for row, account, amount, reason in list(zip(self.rows, self.accounts,
+                                                     self.amounts, self.reasons))[:limit]:
+            lines.append(f"  Row {row + 1}: account {account}, amount {amount:.2f} - {reason}")
+        if self.rejected > limit:
+            lines.append(f"  ... and {self.rejected - limit} more.")
+        return '\n'.join(lines)
+
+
+class BatchLedger:
+    """Balances for many accounts in one NumPy array, indexed by account number.
+
+    Amounts are kept in integer cents so batch results are exact. A
+    withdrawal follows the same rule as BankAccount.withdraw: it is applied
+    only if the balance at that point, after the account's earlier
+    transactions in the batch, covers it.
+    """
+
+    def __init__(self, size=0):
+        self.balances = np.zeros(size + 1, dtype=np.int64)
+        self.is_open = np.zeros(size + 1, dtype=bool)
+
+    @classmethod
+    def from_accounts(cls, accounts):
+        accounts = list(accounts)
+        ledger = cls(max((account.accountNumber for account in accounts), default=0))
+        for account in accounts:
+            ledger.open_account(account.accountNumber, account.balance)
+        return ledger
+
+    def open_account(self, number, balance=0):
+        if number >= len(self.balances):
+            grow = max(number + 1, 2 * len(self.balances)) - len(self.balances)
+            self.balances = np.concatenate([self.balances, np.zeros(grow, dtype=np.int64)])
+            self.is_open = np.concatenate([self.is_open, np.zeros(grow, dtype=bool)])
+        self.balances[number] = round(balance * 100)
+        self.is_open[number] = True
+
+    def balance(self, number):
+        return int(self.balances[number]) / 100
+
+    def sync_to(self, accounts):
+        # Copy balances back onto BankAccount objects.
+        for account in accounts:
+            account.balance = self.balance(account.accountNumber)
+
+    def apply_file(self, path):
+        return self.apply(*read_transactions(path))
+
+    def apply(self, accounts, kinds, amounts):
+        """Apply transactions given as parallel arrays, in order.
+
+        `kinds` holds DEPOSIT/WITHDRAW codes and `amounts` dollars. Returns a
+        BatchResult with every rejected row.
+        """
+        accounts = np.asarray(accounts, dtype=np.int64)
+        kinds = np.asarray(kinds, dtype=np.int8)
+        cents = np.rint(np.asarray(amounts, dtype=np.float64) * 100).astype(np.int64)
+        rows = np.arange(len(accounts))
+
+        known = (accounts >= 0) & (accounts < len(self.balances))
+        known[known] = self.is_open[accounts[known]]
+        missing = rows[~known]
+
+        # Group by account, keeping file order inside each group.
+        order = np.argsort(accounts[known], kind='stable')
+        rows_sorted = rows[known][order]
+        accounts_sorted = accounts[rows_sorted]
+        withdrawals = kinds[rows_sorted] == WITHDRAW
+        signed = np.where(withdrawals, -cents[rows_sorted], cents[rows_sorted])
+
+        starts = np.flatnonzero(np.diff(accounts_sorted, prepend=-1))
+        sizes = np.diff(np.append(starts, len(accounts_sorted)))
+        ends = starts + sizes - 1
+        group_accounts = accounts_sorted[starts]
+
+        # Running balance per account if every withdrawal went through.
+        running = np.cumsum(signed)
+        before_group = running[starts] - signed[starts]
+        running += np.repeat(self.balances[group_accounts] - before_group, sizes)
+
+        # Where the optimistic balance never dips below zero every
+        # withdrawal was covered, so the whole group is accepted at once.
+        overdrawn = np.zeros(len(starts), dtype=bool)
+        if len(running):
+            overdrawn = np.logical_or.reduceat(running < 0, starts)
+        clean = ~overdrawn
+        self.balances[group_accounts[clean]] = running[ends[clean]]
+
+        bounced = self._resolve_overdrawn(signed, withdrawals, starts, sizes,
+                                          group_accounts, overdrawn)
+        insufficient = rows_sorted[bounced]
+
+        rejected = np.concatenate([missing, insufficient])
+        reasons = [ACCOUNT_NOT_FOUND] * len(missing) + [INSUFFICIENT_BALANCE] * len(insufficient)
+        order = np.argsort(rejected, kind='stable')
+        rejected = rejected[order]
+        return BatchResult(
+            applied=len(accounts) - len(rejected),
+            rows=rejected,
+            accounts=accounts[rejected],
+            amounts=cents[rejected] / 100,
+            reasons=[reasons[i] for i in order],
+        )
+
+    def _resolve_overdrawn(self, signed, withdrawals, starts, sizes, group_accounts, pending,
+                           max_rounds=32):
+        """Find the bounced withdrawals of the accounts whose optimistic
+        running balance went negative; returns their sorted positions.
+
+        In each round the first withdrawal that leaves an account below
+        zero is rejected: everything before it was decided correctly, so
+        that rejection is final. The running balance of the remaining
+        accounts is then recomputed without it. Accounts still unresolved
+        after `max_rounds` are replayed one transaction at a time.
+        """
+        bounced = np.zeros(len(signed), dtype=bool)
+        pending = pending.copy()
+        for _ in range(max_rounds):
+            if not pending.any():
+                return np.flatnonzero(bounced)
+            group_starts = starts[pending]
+            group_sizes = sizes[pending]
+            sub_starts = np.cumsum(group_sizes) - group_sizes
+            total = int(group_sizes.sum())
+            positions = np.repeat(group_starts - sub_starts, group_sizes) + np.arange(total)
+
+            amounts = np.where(bounced[positions], 0, signed[positions])
+            running = np.cumsum(amounts)
+            before_group = running[sub_starts] - amounts[sub_starts]
+            running += np.repeat(self.balances[group_accounts[pending]] - before_group, group_sizes)
+
+            candidates = (running < 0) & withdrawals[positions] & ~bounced[positions]
+            first = np.minimum.reduceat(np.where(candidates, np.arange(total), total), sub_starts)
+            found = first < total
+            bounced[positions[first[found]]] = True
+
+            done = np.flatnonzero(pending)[~found]
+            self.balances[group_accounts[done]] = running[(sub_starts + group_sizes - 1)[~found]]
+            pending[done] = False
+
+        for group in np.flatnonzero(pending):
+            start, end = int(starts[group]), int(starts[group] + sizes[group])
+            balance = int(self.balances[group_accounts[group]])
+            amounts = signed[start:end].tolist()
+            flags = withdrawals[start:end].tolist()
+            skipped = bounced[start:end].tolist()
+            for offset, (amount, withdrawal) in enumerate(zip(amounts, flags)):
+                if skipped[offset]:
+                    continue
+                if withdrawal and balance + amount < 0:
+                    bounced[start + offset] = True
+                else:
+                    balance += amount
+            self.balances[group_accounts[group]] = balance
+        return np.flatnonzero(bounced)
+
+
+def read_transactions(path):
+    """Read `account,type,amount` rows (optional header) into arrays."""
+    accounts = []
+    kinds = []
+    amounts = []
+    with open(path, newline='') as file:
+        for line_no, row in enumerate(csv.reader(file), start=1):
+            if not row:
+                continue
+            if line_no == 1 and not row[0].strip().isdigit():
+                continue
+            try:
+                accounts.append(int(row[0]))
+                kinds.append(TRANSACTION_TYPES[row[1].strip().lower()])
+                amounts.append(float(row[2]))
+            except (IndexError, KeyError, ValueError):
+                raise ValueError(f"Invalid transaction on line {line_no}: {','.join(row)}")
+    return (np.array(accounts, dtype=np.int64), np.array(kinds, dtype=np.int8),
+            np.array(amounts, dtype=np.float64))
@@ -0,0 +1,65 @@
+import contextlib
+import importlib.util
+import os
+import random
+import time
+
+import numpy as np
+
+from batch_engine import DEPOSIT, WITHDRAW, BatchLedger
+
+# The menu script's file name is not a valid module name.
+spec = importlib.util.spec_from_file_location(
+    'bank_account_system', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                        'Bank-Account-System.py'))
+bank_account_system = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bank_account_system)
+BankAccount = bank_account_system.BankAccount
+
+
+def make_transactions(account_count, count, seed=1):
+    rng = np.random.default_rng(seed)
+    accounts = rng.integers(1, account_count + 1, count)
+    kinds = np.where(rng.random(count) < 0.5, DEPOSIT, WITHDRAW).astype(np.int8)
+    amounts = rng.integers(1, 50_000, count) / 100
+    return accounts, kinds, amounts
+
+
+def bench_batch(account_count=10_000, count=1_000_000):
+    random.seed(1)
+    opening = [random.randint(0, 2000) for _ in range(account_count)]
+    accounts, kinds, amounts = make_transactions(account_count, count)
+
+    # Per-object loop, the way the menu applies one transaction at a time.
+    objects = {number: BankAccount(f"Owner {number}", number, opening[number - 1])
+               for number in range(1, account_count + 1)}
+    rows = list(zip(accounts.tolist(), kinds.tolist(), amounts.tolist()))
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for number, kind, amount in rows:
+            if kind == DEPOSIT:
+                objects[number].deposit(amount)
+            else:
+                objects[number].withdraw(amount)
+        loop = time.perf_counter() - start
+
+    ledger = BatchLedger.from_accounts(
+        BankAccount(f"Owner {number}", number, opening[number - 1])
+        for number in range(1, account_count + 1))
+    start = time.perf_counter()
+    result = ledger.apply(accounts, kinds, amounts)
+    batch = time.perf_counter() - start
+
+    # The float loop and the cent-exact ledger should agree to the cent.
+    mismatched = sum(1 for number, account in objects.items()
+                     if round(account.balance * 100) != ledger.balances[number])
+
+    print(f"{count} transactions over {account_count} accounts")
+    print(f"Per-object loop: {loop:.2f} s ({count / loop:,.0f} tx/s)")
+    print(f"Batch ledger:    {batch:.2f} s ({count / batch:,.0f} tx/s)")
+    print(f"Rejected (insufficient funds): {result.rejected}")
+    print(f"Accounts differing from the loop: {mismatched}")
+
+
+if __name__ == "__main__":
+    bench_batch()
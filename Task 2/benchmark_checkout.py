@@ -0,0 +1,59 @@
+import importlib.util
+import os
+import random
+import time
+
+from checkout_engine import PricingRules, cart_lines, price_cart, price_carts
+
+# The menu script's file name is not a valid module name.
+spec = importlib.util.spec_from_file_location(
+    'online_shopping_cart', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         'Online-Shopping-Cart.py'))
+online_shopping_cart = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(online_shopping_cart)
+Cart = online_shopping_cart.Cart
+
+
+def make_carts(count, seed=1):
+    rng = random.Random(seed)
+    catalog = [(f"Item {i}", rng.randint(99, 49_999) / 100) for i in range(5000)]
+    carts = []
+    for _ in range(count):
+        cart = Cart()
+        for item_name, price in rng.sample(catalog, rng.randint(1, 20)):
+            cart.add(item_name, price, rng.randint(1, 5))
+        carts.append(cart)
+    return carts
+
+
+def bench_checkout(count=200_000, processes=None):
+    processes = processes or max(2, os.cpu_count())
+    rules = PricingRules(tax_rate=825,
+                         item_discounts={f"Item {i}": 2000 for i in range(0, 5000, 7)},
+                         order_discounts=[(10_000, 500), (50_000, 1000)])
+    carts = make_carts(count)
+    lines = [cart_lines(cart) for cart in carts]
+
+    start = time.perf_counter()
+    single = [price_cart(cart, rules) for cart in lines]
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pooled = list(price_carts(lines, rules, processes=processes))
+    parallel = time.perf_counter() - start
+
+    # With no rules the receipt subtotal is the cart's running subtotal.
+    plain = PricingRules()
+    subtotals_match = all(price_cart(cart_lines(cart), plain).total / 100 == cart.subtotal
+                          for cart in carts[:10_000])
+
+    print(f"{count:,} carts, {sum(map(len, lines)):,} lines, {os.cpu_count()} CPU(s)")
+    print(f"price_cart loop:           {one_by_one:.2f} s ({count / one_by_one:,.0f} carts/s)")
+    print(f"price_carts, {processes} processes: {parallel:.2f} s ({count / parallel:,.0f} carts/s)")
+    print(f"Batch identical to single-cart pricing: {pooled == single}")
+    print(f"Subtotals match Cart.subtotal: {subtotals_match}")
+    print(f"Revenue: ${sum(receipt.total for receipt in single) / 100:,.2f}")
+
+
+if __name__ == "__main__":
+    bench_checkout()
@@ -0,0 +1,142 @@
+import contextlib
+import importlib.util
+import os
+import random
+import time
+
+from reservations import PRIORITY, STANDARD, Waitlists
+
+# The menu script's file name is not a valid module name.
+spec = importlib.util.spec_from_file_location(
+    'library_management_system', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                              'Library-Management-System.py'))
+library_management_system = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(library_management_system)
+Book = library_management_system.Book
+Library = library_management_system.Library
+
+
+def make_books(count):
+    return [Book(f"Title {i}", f"Author {i % 10_000}", f"978-{i:09d}") for i in range(count)]
+
+
+def bench_library(count=1_000_000, operations=100_000, seed=1):
+    rng = random.Random(seed)
+    books = make_books(count)
+
+    start = time.perf_counter()
+    library = Library(books)
+    build = time.perf_counter() - start
+
+    ISBNs = [books[rng.randrange(count)].ISBN for _ in range(operations)]
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for ISBN in ISBNs:
+            library.borrow(ISBN)
+        for ISBN in ISBNs:
+            library.return_book(ISBN)
+        indexed = time.perf_counter() - start
+
+        # The old menu: find the book by scanning, check a borrowed list.
+        scans = 100
+        borrowed_books = [books[i] for i in range(0, count, count // 10_000)]
+        start = time.perf_counter()
+        for ISBN in ISBNs[:scans]:
+            book = next(book for book in books if book.ISBN == ISBN)
+            if book not in borrowed_books:
+                book.borrowbook()
+                borrowed_books.append(book)
+                book.returnbook()
+                borrowed_books.remove(book)
+        scanned = time.perf_counter() - start
+
+    print(f"{count:,} books")
+    print(f"Build Library:   {build:.2f} s")
+    print(f"Indexed borrow + return: {indexed / operations * 1e6:>10.1f} us per book")
+    print(f"List scans (10,000 borrowed): {scanned / scans * 1e6:>10.1f} us per book")
+    print(f"Available after returns: {len(library.available):,}")
+
+
+def churn(titles, waiting, operations, seed):
+    """A random mix of reserve (50%), cancel (30%) and serve (20%) calls
+    over `titles` popular books with about `waiting` members each."""
+    rng = random.Random(seed)
+    for _ in range(operations):
+        ISBN = rng.randrange(titles)
+        roll = rng.random()
+        member = rng.randrange(waiting * 2)
+        if roll < 0.5:
+            yield 'reserve', ISBN, member, PRIORITY if roll < 0.05 else STANDARD
+        elif roll < 0.8:
+            yield 'cancel', ISBN, member, None
+        else:
+            yield 'next', ISBN, None, None
+
+
+class ListWaitlists:
+    """Unsorted lists with linear scans, the obvious alternative to heaps."""
+
+    def __init__(self):
+        self.queues = {}
+        self.sequence = 0
+
+    def reserve(self, ISBN, member, tier):
+        queue = self.queues.setdefault(ISBN, [])
+        if any(hold[2] == member for hold in queue):
+            return False
+        self.sequence += 1
+        queue.append((tier, self.sequence, member))
+        return True
+
+    def cancel(self, ISBN, member):
+        queue = self.queues.get(ISBN, [])
+        for index, hold in enumerate(queue):
+            if hold[2] == member:
+                del queue[index]
+                return True
+        return False
+
+    def next_member(self, ISBN):
+        queue = self.queues.get(ISBN)
+        if not queue:
+            return None
+        first = min(queue)
+        queue.remove(first)
+        return first[2]
+
+
+def run_churn(waitlists, operations):
+    served = []
+    for kind, ISBN, member, tier in operations:
+        if kind == 'reserve':
+            waitlists.reserve(ISBN, member, tier)
+        elif kind == 'cancel':
+            waitlists.cancel(ISBN, member)
+        else:
+            served.append(waitlists.next_member(ISBN))
+    return served
+
+
+def bench_waitlists(titles=100, waiting=500, operations=1_000_000, seed=1):
+    # Fill every queue to about `waiting` members first.
+    warmup = [('reserve', ISBN, member, STANDARD)
+              for ISBN in range(titles) for member in range(waiting)]
+    operations = list(churn(titles, waiting, operations, seed))
+    results = {}
+    for name, waitlists in (('Heap waitlists', Waitlists()), ('List scans', ListWaitlists())):
+        run_churn(waitlists, warmup)
+        start = time.perf_counter()
+        served = run_churn(waitlists, operations)
+        results[name] = (time.perf_counter() - start, served)
+
+    print(f"\n{len(operations):,} reserve/cancel/serve calls over {titles} titles, "
+          f"~{waiting} members waiting on each")
+    for name, (elapsed, _) in results.items():
+        print(f"{name + ':':<16} {elapsed:.2f} s ({len(operations) / elapsed:,.0f} ops/s)")
+    heap_served, list_served = (served for _, served in results.values())
+    print(f"Same members served: {heap_served == list_served}")
+
+
+if __name__ == "__main__":
+    bench_library()
+    bench_waitlists()
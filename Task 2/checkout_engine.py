@@ -0,0 +1,84 @@
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# All amounts in integer cents.
+Receipt = namedtuple('Receipt', 'subtotal discount tax total')
+
+
+class PricingRules:
+    """Tax and discount rules, all integers so pricing is exact.
+
+    Rates are in basis points (hundredths of a percent: 825 is 8.25%).
+    `item_discounts` maps an item name to its sale discount rate.
+    `order_discounts` lists (minimum order in cents, rate) tiers; the
+    highest tier the order reaches after item discounts applies.
+    """
+
+    def __init__(self, tax_rate=0, item_discounts=None, order_discounts=()):
+        self.tax_rate = tax_rate
+        self.item_discounts = item_discounts or {}
+        self.order_discounts = sorted(order_discounts, reverse=True)
+
+
+def to_cents(amount):
+    return round(amount * 100)
+
+
+def cart_lines(cart):
+    """(item name, price in cents, quantity) for each CartItem in a cart."""
+    return [(item.item_name, to_cents(item.price), item.quantity) for item in cart]
+
+
+def price_cart(lines, rules):
+    subtotal = discount = 0
+    item_discounts = rules.item_discounts
+    for item_name, price, quantity in lines:
+        line = price * quantity
+        subtotal += line
+        rate = item_discounts.get(item_name)
+        if rate:
+            discount += _share(line, rate)
+    for minimum, rate in rules.order_discounts:
+        if subtotal - discount >= minimum:
+            discount += _share(subtotal - discount, rate)
+            break
+    taxable = subtotal - discount
+    tax = _share(taxable, rules.tax_rate)
+    return Receipt(subtotal, discount, tax, taxable + tax)
+
+
+def price_carts(carts, rules, processes=None, chunk_size=2000):
+    """Yield a Receipt for each cart (a list from cart_lines), in order.
+
+    Carts are sent to worker processes `chunk_size` at a time, which keeps
+    the pickling overhead per cart small. At most two chunks per worker
+    are in flight, so `carts` can be a generator over more carts than fit
+    in memory. processes=1 prices in this process with the same code.
+    """
+    processes = processes or os.cpu_count()
+    carts = iter(carts)
+    chunks = iter(lambda: list(islice(carts, chunk_size)), [])
+    if processes == 1:
+        for chunk in chunks:
+            yield from _price_chunk(chunk, rules)
+        return
+
+    with ProcessPoolExecutor(processes) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_price_chunk, chunk, rules))
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _price_chunk(chunk, rules):
+    return [price_cart(lines, rules) for lines in chunk]
+
+
+def _share(cents, rate):
+    # `rate` basis points of `cents`, rounded half up.
+    return (cents * rate + 5000) // 10000
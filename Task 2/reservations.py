@@ -0,0 +1,78 @@
+import heapq
+from itertools import count
+
+# Priority tiers; a lower tier is served first.
+PRIORITY = 0
+STANDARD = 1
+
+
+class Waitlists:
+    """Reservation queues for books, one heap per ISBN.
+
+    Holds are served by tier, then in the order they were made. Cancelling
+    only marks the hold; it stays in the heap until it reaches the top and
+    is skipped there, so reserve and next_member are O(log n) and cancel
+    is O(1). A heap that becomes mostly cancelled holds is rebuilt, which
+    keeps memory bounded under heavy churn.
+    """
+
+    def __init__(self):
+        # ISBN -> heap of [tier, sequence, member, active]
+        self._queues = {}
+        # (ISBN, member) -> that member's heap entry
+        self._holds = {}
+        # ISBN -> number of cancelled entries still in the heap
+        self._cancelled = {}
+        self._sequence = count()
+
+    def __len__(self):
+        return len(self._holds)
+
+    def waiting(self, ISBN):
+        return len(self._queues.get(ISBN, ())) - self._cancelled.get(ISBN, 0)
+
+    def has_hold(self, ISBN, member):
+        return (ISBN, member) in self._holds
+
+    def reserve(self, ISBN, member, tier=STANDARD):
+        """Add a hold; returns False if the member already has one."""
+        if (ISBN, member) in self._holds:
+            return False
+        entry = [tier, next(self._sequence), member, True]
+        self._holds[ISBN, member] = entry
+        heapq.heappush(self._queues.setdefault(ISBN, []), entry)
+        return True
+
+    def cancel(self, ISBN, member):
+        entry = self._holds.pop((ISBN, member), None)
+        if entry is None:
+            return False
+        entry[3] = False
+        cancelled = self._cancelled.get(ISBN, 0) + 1
+        queue = self._queues[ISBN]
+        if cancelled * 2 > len(queue):
+            queue[:] = [entry for entry in queue if entry[3]]
+            heapq.heapify(queue)
+            cancelled = 0
+        self._cancelled[ISBN] = cancelled
+        if not queue:
+            self._drop(ISBN)
+        return True
+
+    def next_member(self, ISBN):
+        """Remove and return the member first in line, or None."""
+        queue = self._queues.get(ISBN)
+        while queue:
+            tier, sequence, member, active = heapq.heappop(queue)
+            if active:
+                del self._holds[ISBN, member]
+                if not queue:
+                    self._drop(ISBN)
+                return member
+            self._cancelled[ISBN] -= 1
+        self._drop(ISBN)
+        return None
+
+    def _drop(self, ISBN):
+        self._queues.pop(ISBN, None)
+        self._cancelled.pop(ISBN, None)
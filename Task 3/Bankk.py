@@ -1,115 +1,160 @@
+import hashlib
+import hmac
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from account_registry import AccountRegistry
+from sessions import AccountLockedError, SessionManager
+
 class BankAccount:
-    def __init__(self, account_holder, balance, pin):
+    # PBKDF2 rounds per PIN check, roughly 40 ms. A 4-digit PIN has only
+    # 10,000 values, so the cost of each guess is what protects it.
+    PIN_ITERATIONS = 100_000
+
+    def __init__(self, account_holder, balance, pin, account_number):
         self.ownerName = account_holder
         self._balance = balance
-        self.__pin = pin
-        self.accountNumber = len(accounts) + 1
+        # Only a salted hash of the PIN is kept.
+        self.__salt = os.urandom(16)
+        self.__pin_hash = self._hash_pin(pin, self.__salt)
+        self.accountNumber = account_number
         
-    def set_balance(self, amount):
+    @property
+    def balance(self):
+        return self._balance
+
+    # The methods below return their messages instead of printing them, so
+    # the same class serves the menu and the network server.
+    def deposit(self, amount):
         self._balance += amount
-        print(f"\n{self.ownerName} deposited {amount}. New Balance: ${self._balance}")
+        return f"{self.ownerName} deposited {amount}. New Balance: ${self._balance}"
 
     def withdraw(self, amount):
         if self._balance >= amount:
             self._balance -= amount
-            print(f"\n{self.ownerName} withdrew {amount}. New Balance: ${self._balance}")
-        else:
-            print("Insufficient Balance")
+            return f"{self.ownerName} withdrew {amount}. New Balance: ${self._balance}"
+        return "Insufficient Balance"
 
     def get_balance(self):
-        print(f"\nAccount Balance for {self.ownerName}: ${self._balance}")
+        return f"Account Balance for {self.ownerName}: ${self._balance}"
     
     def verify_pin(self, pin):
         if not pin.isdigit() or len(pin) != 4:
-            print("Invalid PIN. Please enter a 4-digit number.")
             return False
-        return self.__pin == pin
+        return hmac.compare_digest(self._hash_pin(pin, self.__salt), self.__pin_hash)
+
+    @classmethod
+    def _hash_pin(cls, pin, salt):
+        return hashlib.pbkdf2_hmac('sha256', pin.encode(), salt, cls.PIN_ITERATIONS)
         
-accounts = []
+accounts = AccountRegistry()
+sessions = SessionManager()
+# Menu session per account number, so the PIN is asked once per session.
+tokens = {}
+
+def authenticate(account):
+    token = tokens.get(account.accountNumber)
+    if token and sessions.check(token, account.accountNumber):
+        return True
+    pin = input("Enter 4-digit pin: ")
+    try:
+        token = sessions.login(account, pin)
+    except AccountLockedError as e:
+        print(f"\n{e}")
+        return False
+    if token is None:
+        print("\nInvalid PIN. Access denied.")
+        return False
+    tokens[account.accountNumber] = token
+    return True
 
-while True:
-    print("\nBank Account Menu:")
-    print("1. Create Account")
-    print("2. List Accounts")
-    print("3. Deposit")
-    print("4. Withdraw")
-    print("5. Check Balance")
-    print("6. Exit")
+if __name__ == "__main__":
+    while True:
+        print("\nBank Account Menu:")
+        print("1. Create Account")
+        print("2. List Accounts")
+        print("3. Deposit")
+        print("4. Withdraw")
+        print("5. Check Balance")
+        print("6. Find Accounts by Owner")
+        print("7. Exit")
     
-    menu = input("Select an option: ")
+        menu = input("Select an option: ")
     
-    if menu == "1":
-        try:
-            ownerName = input("\nEnter account owner name: ")
-            balance = float(input("Enter initial balance: "))
-            pin = input("Enter 4-digit pin: ")
-            if not pin.isdigit() or len(pin) != 4:
-                print("\nInvalid PIN. Please enter a 4-digit number.")
-                continue
-            account = BankAccount(ownerName, balance, pin)
-            accounts.append(account)
-            print(f"\nAccount created successfully. Account Number: {account.accountNumber}")
-        except ValueError:
-            print("\nInvalid input. Please enter a valid number for the balance.")
+        if menu == "1":
+            try:
+                ownerName = input("\nEnter account owner name: ")
+                balance = float(input("Enter initial balance: "))
+                pin = input("Enter 4-digit pin: ")
+                if not pin.isdigit() or len(pin) != 4:
+                    print("\nInvalid PIN. Please enter a 4-digit number.")
+                    continue
+                account = BankAccount(ownerName, balance, pin, accounts.next_number())
+                accounts.add(account.accountNumber, account, owner=ownerName)
+                print(f"\nAccount created successfully. Account Number: {account.accountNumber}")
+            except ValueError:
+                print("\nInvalid input. Please enter a valid number for the balance.")
     
-    elif menu == "2":
-        if accounts:
-            print("\nAccounts:")
-            for account in accounts:
-                print(f"{account.accountNumber} | Owner: {account.ownerName}")
-        else:
-            print("\nNo accounts found.")
+        elif menu == "2":
+            if accounts:
+                print("\nAccounts:")
+                for account in accounts:
+                    print(f"{account.accountNumber} | Owner: {account.ownerName}")
+            else:
+                print("\nNo accounts found.")
     
-    elif menu == "3":
-        try:
-            account_number = int(input("\nEnter account number: "))
-            account = next((acc for acc in accounts if acc.accountNumber == account_number), None)
-            if account:
-                pin = input("Enter 4-digit pin: ")
-                if account.verify_pin(pin):
-                    amount = float(input("Enter deposit amount: "))
-                    account.deposit(amount)
+        elif menu == "3":
+            try:
+                account_number = int(input("\nEnter account number: "))
+                account = accounts.get(account_number)
+                if account:
+                    if authenticate(account):
+                        amount = float(input("Enter deposit amount: "))
+                        print(f"\n{account.deposit(amount)}")
                 else:
-                    print("\nInvalid PIN. Access denied.")
-            else:
-                print("\nAccount not found.")
-        except ValueError:
-            print("\nInvalid input. Please enter a valid number for the account number and deposit amount.")
+                    print("\nAccount not found.")
+            except ValueError:
+                print("\nInvalid input. Please enter a valid number for the account number and deposit amount.")
     
-    elif menu == "4":
-        try:
-            account_number = int(input("\nEnter account number: "))
-            account = next((acc for acc in accounts if acc.accountNumber == account_number), None)
-            if account:
-                pin = input("Enter 4-digit pin: ")
-                if account.verify_pin(pin):
-                    amount = float(input("Enter withdrawal amount: "))
-                    account.withdraw(amount)
+        elif menu == "4":
+            try:
+                account_number = int(input("\nEnter account number: "))
+                account = accounts.get(account_number)
+                if account:
+                    if authenticate(account):
+                        amount = float(input("Enter withdrawal amount: "))
+                        print(f"\n{account.withdraw(amount)}")
                 else:
-                    print("\nInvalid PIN. Access denied.")
-            else:
-                print("\nAccount not found.")
-        except ValueError:
-            print("\nInvalid input. Please enter a valid number for the account number and withdrawal amount.")
+                    print("\nAccount not found.")
+            except ValueError:
+                print("\nInvalid input. Please enter a valid number for the account number and withdrawal amount.")
     
-    elif menu == "5":
-        try:
-            account_number = int(input("\nEnter account number: "))
-            account = next((acc for acc in accounts if acc.accountNumber == account_number), None)
-            if account:
-                pin = input("Enter 4-digit pin: ")
-                if account.verify_pin(pin):
-                    account.get_balance()
+        elif menu == "5":
+            try:
+                account_number = int(input("\nEnter account number: "))
+                account = accounts.get(account_number)
+                if account:
+                    if authenticate(account):
+                        print(f"\n{account.get_balance()}")
                 else:
-                    print("\nInvalid PIN. Access denied.")
+                    print("\nAccount not found.")
+            except ValueError:
+                print("\nInvalid input. Please enter a valid number for the account number.")
+    
+        elif menu == "6":
+            ownerName = input("\nEnter account owner name: ")
+            owned = accounts.find_by_owner(ownerName)
+            if owned:
+                print("\nAccounts:")
+                for account in owned:
+                    print(f"{account.accountNumber} | Owner: {account.ownerName}")
             else:
-                print("\nAccount not found.")
-        except ValueError:
-            print("\nInvalid input. Please enter a valid number for the account number.")
+                print("\nNo accounts found.")
     
-    elif menu == "6":
-        print("\nGoodbye!")
-        break
+        elif menu == "7":
+            print("\nGoodbye!")
+            break
     
-    else:
-        print("\nInvalid option. Please try again.")
\ No newline at end of file
+        else:
+            print("\nInvalid option. Please try again.")
\ No newline at end of file
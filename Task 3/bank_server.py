@@ -0,0 +1,144 @@
+import argparse
+import asyncio
+
+from Bankk import AccountRegistry, BankAccount
+from sessions import AccountLockedError, SessionManager
+
+HELP = ("Commands: CREATE <balance> <pin> <owner name> | LIST | LOGIN <account> <pin> | "
+        "DEPOSIT <account> <pin|token> <amount> | WITHDRAW <account> <pin|token> <amount> | "
+        "BALANCE <account> <pin|token> | QUIT")
+
+
+class BankServer:
+    """Line protocol over TCP for the Task 3 bank menu.
+
+    Every request is one line and gets one `OK ...` or `ERR ...` line back,
+    except LIST, which answers `OK <count>` followed by one `<number> <owner>`
+    line per account. All connections share one event loop and the account
+    operations never await, so each command runs atomically without locks.
+
+    PIN hashing is deliberately slow, so it runs in worker threads rather
+    than on the event loop. LOGIN answers `OK <token>`; the token can then
+    replace the PIN in later commands and is checked with a dict lookup.
+    """
+
+    def __init__(self, sessions=None):
+        self.accounts = AccountRegistry()
+        self.sessions = sessions or SessionManager()
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode(errors='replace').strip()
+                if command.upper() == 'QUIT':
+                    writer.write(b"OK Goodbye!\n")
+                    await writer.drain()
+                    break
+                writer.write((await self.execute(command)).encode() + b"\n")
+                # Backpressure: wait if this client is not reading replies.
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def execute(self, command):
+        parts = command.split()
+        if not parts:
+            return f"ERR {HELP}"
+        name, args = parts[0].upper(), parts[1:]
+        try:
+            if name == 'CREATE' and len(args) >= 3:
+                return await self.create(float(args[0]), args[1], ' '.join(args[2:]))
+            if name == 'LIST' and not args:
+                return self.list_accounts()
+            if name == 'LOGIN' and len(args) == 2:
+                return await self.login(int(args[0]), args[1])
+            if name in ('DEPOSIT', 'WITHDRAW') and len(args) == 3:
+                account = await self.authorize(int(args[0]), args[1])
+                return self.transact(name, account, float(args[2]))
+            if name == 'BALANCE' and len(args) == 2:
+                account = await self.authorize(int(args[0]), args[1])
+                return f"OK {account.balance}"
+        except ValueError:
+            return "ERR Invalid input. Please enter valid numbers."
+        except (LookupError, AccountLockedError) as e:
+            return f"ERR {e.args[0]}"
+        return f"ERR {HELP}"
+
+    async def create(self, balance, pin, owner):
+        if not pin.isdigit() or len(pin) != 4:
+            return "ERR Invalid PIN. Please enter a 4-digit number."
+        # Build the account (and hash its PIN) before taking a number, so
+        # numbers stay sequential however the threads finish.
+        account = await asyncio.to_thread(BankAccount, owner, balance, pin, None)
+        account.accountNumber = self.accounts.next_number()
+        self.accounts.add(account.accountNumber, account, owner=owner)
+        return f"OK {account.accountNumber}"
+
+    def list_accounts(self):
+        lines = [f"OK {len(self.accounts)}"]
+        lines.extend(f"{account.accountNumber} {account.ownerName}" for account in self.accounts)
+        return "\n".join(lines)
+
+    async def login(self, number, pin):
+        account = self.find(number)
+        token = await asyncio.to_thread(self.sessions.login, account, pin)
+        if token is None:
+            raise LookupError("Invalid PIN. Access denied.")
+        return f"OK {token}"
+
+    def transact(self, name, account, amount):
+        if name == 'DEPOSIT':
+            account.deposit(amount)
+            return f"OK {account.balance}"
+        before = account.balance
+        message = account.withdraw(amount)
+        if account.balance == before and amount:
+            return f"ERR {message}"
+        return f"OK {account.balance}"
+
+    async def authorize(self, number, credential):
+        account = self.find(number)
+        # A session token never looks like a PIN: it is 22 URL-safe characters.
+        if len(credential) != 4:
+            if self.sessions.check(credential, number) is None:
+                raise LookupError("Session expired or invalid. Please LOGIN again.")
+            return account
+        if not await asyncio.to_thread(self.sessions.verify, account, credential):
+            raise LookupError("Invalid PIN. Access denied.")
+        return account
+
+    def find(self, number):
+        account = self.accounts.get(number)
+        if account is None:
+            raise LookupError("Account not found.")
+        return account
+
+
+async def serve(host, port, server=None, backlog=4096):
+    server = server or BankServer()
+    return await asyncio.start_server(server.handle, host, port, backlog=backlog)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Bank account server (line protocol)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8888)
+    args = parser.parse_args()
+
+    tcp_server = await serve(args.host, args.port)
+    print(f"Bank server listening on {args.host}:{args.port}")
+    print(HELP)
+    async with tcp_server:
+        await tcp_server.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nGoodbye!")
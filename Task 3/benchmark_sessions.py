@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+from Bankk import BankAccount
+from load_client import run
+from sessions import SessionManager
+
+
+def bench_sessions(account_count=20, operations=400):
+    accounts = [BankAccount(f"Owner {number}", 1000, f"{number:04d}", number)
+                for number in range(1, account_count + 1)]
+    sessions = SessionManager()
+
+    # Without sessions every operation pays for a full PIN hash.
+    start = time.perf_counter()
+    for i in range(operations):
+        account = accounts[i % account_count]
+        if sessions.verify(account, f"{account.accountNumber:04d}"):
+            account.deposit(1)
+    per_pin = time.perf_counter() - start
+
+    # With sessions the hash runs once per login; each operation is a lookup.
+    tokens = [sessions.login(account, f"{account.accountNumber:04d}") for account in accounts]
+    session_ops = operations * 1000
+    start = time.perf_counter()
+    for i in range(session_ops):
+        index = i % account_count
+        account = sessions.check(tokens[index], index + 1)
+        if account:
+            account.deposit(1)
+    per_token = time.perf_counter() - start
+
+    print(f"In-process, {account_count} accounts, PBKDF2 x {BankAccount.PIN_ITERATIONS:,}")
+    print(f"PIN every operation: {operations / per_pin:>12,.0f} ops/sec")
+    print(f"Session token:       {session_ops / per_token:>12,.0f} ops/sec "
+          f"({per_pin / operations / (per_token / session_ops):,.0f}x)")
+
+
+if __name__ == "__main__":
+    bench_sessions()
+    print("\nOver TCP (load_client.py --in-process):")
+    asyncio.run(run('127.0.0.1', 0, 20, 10, True, sessions=False))
+    asyncio.run(run('127.0.0.1', 0, 20, 10, True, sessions=True))
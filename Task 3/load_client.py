@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from bank_server import serve
+
+
+async def request(reader, writer, line, latencies):
+    start = time.perf_counter()
+    writer.write(line.encode() + b"\n")
+    reply = (await reader.readline()).decode().strip()
+    latencies.append(time.perf_counter() - start)
+    if not reply:
+        raise ConnectionError("Server closed the connection")
+    return reply
+
+
+async def client(host, port, requests, latencies, seed, sessions):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    pin = f"{rng.randint(0, 9999):04d}"
+    reply = await request(reader, writer, f"CREATE 1000 {pin} Load Client {seed}", latencies)
+    number = reply.split()[1]
+    credential = pin
+    if sessions:
+        reply = await request(reader, writer, f"LOGIN {number} {pin}", latencies)
+        credential = reply.split()[1]
+        requests -= 1
+    for _ in range(requests - 1):
+        roll = rng.random()
+        if roll < 0.4:
+            line = f"DEPOSIT {number} {credential} {rng.randint(1, 100)}"
+        elif roll < 0.8:
+            line = f"WITHDRAW {number} {credential} {rng.randint(1, 100)}"
+        else:
+            line = f"BALANCE {number} {credential}"
+        await request(reader, writer, line, latencies)
+    writer.write(b"QUIT\n")
+    await reader.readline()
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(host, port, clients, requests, in_process, sessions=True):
+    tcp_server = None
+    if in_process:
+        tcp_server = await serve(host, 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, requests, latencies, seed, sessions)
+                           for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    if tcp_server is not None:
+        tcp_server.close()
+        await tcp_server.wait_closed()
+
+    cuts = statistics.quantiles(latencies, n=100)
+    mode = "session tokens" if sessions else "PIN on every request"
+    print(f"{clients} concurrent clients x {requests} requests = {len(latencies)} operations ({mode})")
+    print(f"Throughput: {len(latencies) / elapsed:,.0f} ops/sec over {elapsed:.2f} s")
+    print(f"Latency p50: {cuts[49] * 1000:.2f} ms, p99: {cuts[98] * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for bank_server.py")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8888)
+    parser.add_argument('--clients', type=int, default=1000,
+                        help="concurrent connections (mind the open file limit)")
+    parser.add_argument('--requests', type=int, default=50, help="requests per client")
+    parser.add_argument('--in-process', action='store_true',
+                        help="start a server in this process instead of connecting to one")
+    parser.add_argument('--no-sessions', action='store_true',
+                        help="send the PIN with every request instead of logging in once")
+    args = parser.parse_args()
+    asyncio.run(run(args.host, args.port, args.clients, args.requests, args.in_process,
+                    not args.no_sessions))
+
+
+if __name__ == "__main__":
+    main()
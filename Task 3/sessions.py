@@ -0,0 +1,106 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+
+class AccountLockedError(Exception):
+    """Raised when an account has too many recent failed PIN attempts."""
+    def __init__(self, account_number, retry_after):
+        message = (f"Too many failed PIN attempts for account {account_number}. "
+                   f"Try again in {retry_after:.0f} seconds.")
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SessionManager:
+    """Short-lived session tokens so the slow PIN hash runs once per login.
+
+    `login` verifies the PIN and issues a token. `check` then costs one dict
+    lookup: tokens live in an LRU cache bounded by `max_sessions` and expire
+    after `ttl` seconds. Each account may fail `max_attempts` PIN checks
+    within `lockout` seconds before further logins are refused for the rest
+    of that window. Checks still being hashed count toward that limit, so
+    concurrent guesses cannot get past it.
+    """
+
+    def __init__(self, ttl=300, max_sessions=10_000, max_attempts=3, lockout=60,
+                 clock=time.monotonic):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_attempts = max_attempts
+        self.lockout = lockout
+        self.clock = clock
+        # token -> (account, expires_at), least recently used first.
+        self._sessions = OrderedDict()
+        # account number -> (failed attempts, time of the first one).
+        self._failures = {}
+        # account number -> PIN checks being hashed right now.
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def login(self, account, pin):
+        """Return a new token, or None if the PIN is wrong."""
+        if not self.verify(account, pin):
+            return None
+        token = secrets.token_urlsafe(16)
+        with self._lock:
+            self._sessions[token] = (account, self.clock() + self.ttl)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return token
+
+    def verify(self, account, pin):
+        """Check a PIN under the per-account attempt limit, without a session."""
+        number = account.accountNumber
+        with self._lock:
+            # Reserve the attempt before hashing; it is settled below.
+            self._check_locked(number)
+            self._pending[number] = self._pending.get(number, 0) + 1
+        verified = None
+        try:
+            # Hash outside the lock so other accounts are not held up.
+            verified = account.verify_pin(pin)
+        finally:
+            with self._lock:
+                pending = self._pending.pop(number) - 1
+                if pending:
+                    self._pending[number] = pending
+                # If the hash raised, the attempt is only released.
+                if verified:
+                    self._failures.pop(number, None)
+                elif verified is not None:
+                    count, since = self._failures.get(number, (0, self.clock()))
+                    self._failures[number] = (count + 1, since)
+        return verified
+
+    def check(self, token, account_number):
+        """Return the account if `token` is a live session for it, else None."""
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None
+            account, expires_at = session
+            if expires_at <= self.clock():
+                del self._sessions[token]
+                return None
+            if account.accountNumber != account_number:
+                return None
+            self._sessions.move_to_end(token)
+            return account
+
+    def logout(self, token):
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def _check_locked(self, number):
+        count, elapsed = 0, 0
+        failure = self._failures.get(number)
+        if failure is not None:
+            count, since = failure
+            elapsed = self.clock() - since
+            if elapsed >= self.lockout:
+                del self._failures[number]
+                count, elapsed = 0, 0
+        if count + self._pending.get(number, 0) >= self.max_attempts:
+            raise AccountLockedError(number, self.lockout - elapsed)
@@ -0,0 +1,76 @@
+import threading
+import time
+
+from Bankk import BankAccount
+from sessions import AccountLockedError, SessionManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingAccount(BankAccount):
+    """Counts how many PIN checks actually get hashed."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.hashed = 0
+        self.count_lock = threading.Lock()
+
+    def verify_pin(self, pin):
+        with self.count_lock:
+            self.hashed += 1
+        return super().verify_pin(pin)
+
+
+def stress(threads=20, max_attempts=3, lockout=60):
+    """Guess PINs from many threads at once, the way concurrent LOGINs
+    reach the server's worker threads, and check the attempt limit holds."""
+    clock = FakeClock()
+    sessions = SessionManager(max_attempts=max_attempts, lockout=lockout, clock=clock)
+    account = CountingAccount("Target", 1000, "4321", 1)
+    # A second account must not be slowed or locked by the first one.
+    other = CountingAccount("Bystander", 1000, "1234", 2)
+    barrier = threading.Barrier(threads)
+    outcomes = []
+
+    def guess(n):
+        barrier.wait()
+        try:
+            outcomes.append(sessions.login(account, f"{n:04d}"))
+        except AccountLockedError:
+            outcomes.append('locked')
+
+    pool = [threading.Thread(target=guess, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    other_ok = sessions.login(other, "1234") is not None
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    hashed = account.hashed
+
+    try:
+        sessions.login(account, "4321")
+        locked_after = False
+    except AccountLockedError:
+        locked_after = True
+    clock.now += lockout
+    unlocked = sessions.login(account, "4321") is not None
+
+    print(f"{threads} concurrent guesses, max_attempts={max_attempts}, in {elapsed:.2f} s")
+    print(f"PINs hashed: {hashed}, refused as locked: {outcomes.count('locked')}")
+    print(f"Attempts hashed within the limit: {hashed <= max_attempts}")
+    print(f"Correct PIN refused while locked: {locked_after}")
+    print(f"Correct PIN accepted after the window: {unlocked}")
+    print(f"Other account unaffected: {other_ok}")
+    return hashed <= max_attempts and locked_after and unlocked and other_ok
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if stress() else 1)
@@ -1,3 +1,9 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'common'))
+from account_registry import AccountRegistry
+
 class BankAccount:
     def __init__(self, account_number, balance):
         self.account_number = account_number
@@ -36,51 +42,48 @@ class PremiumSavingsAccount(SavingsAccount):
         else:
             print("Insufficient funds.")
             
-accounts = [
-    SavingsAccount(1, 1000),
-    PremiumSavingsAccount(2, 2000)
-]
+accounts = AccountRegistry()
+for account in (SavingsAccount(1, 1000), PremiumSavingsAccount(2, 2000)):
+    accounts.add(account.account_number, account)
 
-while True:
-    print("\nBank Account Menu:")
-    print("1. Deposit")
-    print("2. Withdraw")
-    print("3. Check Balance")
-    print("4. Exit")
+if __name__ == "__main__":
+    while True:
+        print("\nBank Account Menu:")
+        print("1. Deposit")
+        print("2. Withdraw")
+        print("3. Check Balance")
+        print("4. Exit")
     
-    menu = input("Select an option: ")
+        menu = input("Select an option: ")
     
-    if menu == "1":
-        account_number = int(input("Enter account number: "))
-        amount = float(input("Enter amount to deposit: "))
-        for account in accounts:
-            if account.account_number == account_number:
+        if menu == "1":
+            account_number = int(input("Enter account number: "))
+            amount = float(input("Enter amount to deposit: "))
+            account = accounts.get(account_number)
+            if account:
                 account.deposit(amount)
-                break
-        else:
-            print("Account not found.")
+            else:
+                print("Account not found.")
     
-    elif menu == "2":
-        account_number = int(input("Enter account number: "))
-        amount = float(input("Enter amount to withdraw: "))
-        for account in accounts:
-            if account.account_number == account_number:
+        elif menu == "2":
+            account_number = int(input("Enter account number: "))
+            amount = float(input("Enter amount to withdraw: "))
+            account = accounts.get(account_number)
+            if account:
                 account.withdraw(amount)
-                break
-        else:
-            print("Account not found.")
+            else:
+                print("Account not found.")
     
-    elif menu == "3":
-        account_number = int(input("Enter account number: "))
-        for account in accounts:
-            if account.account_number == account_number:
+        elif menu == "3":
+            account_number = int(input("Enter account number: "))
+            account = accounts.get(account_number)
+            if account:
                 print(f"Account balance: ${account.balance}")
-                break
-        else:
-            print("Account not found.")
+            else:
+                print("Account not found.")
     
-    elif menu == "4":
-        break
+        elif menu == "4":
+            break
     
-    else:
-        print("Invalid option. Please try again.")
\ No newline at end of file
+        else:
+            print("Invalid option. Please try again.")
\ No newline at end of file
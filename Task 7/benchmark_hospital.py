@@ -0,0 +1,81 @@
+import time
+
+from hospital import Department, Doctor, Hospital, Patient
+
+
+class ListDoctor:
+    """Doctor as it was before the registry: patients kept in a list."""
+
+    def __init__(self, doctor_id, name, specialty):
+        self.doctor_id = doctor_id
+        self.name = name
+        self.specialty = specialty
+        self.patients = []
+
+    def add_patient(self, patient):
+        if patient not in self.patients:
+            self.patients.append(patient)
+
+    def remove_patient(self, patient):
+        if patient in self.patients:
+            self.patients.remove(patient)
+
+
+def build(patient_count, doctor_count=100, department_count=10):
+    hospital = Hospital("Benchmark Hospital")
+    departments = [Department(f"Department {i}") for i in range(department_count)]
+    doctors = [Doctor(i, f"Doctor {i}", "General") for i in range(doctor_count)]
+    for i, doctor in enumerate(doctors):
+        hospital.add_doctor(doctor, departments[i % department_count])
+    for i in range(patient_count):
+        patient = Patient(i, f"Patient {i}", 30)
+        # Every patient sees two doctors.
+        hospital.admit_patient(patient, doctors[i % doctor_count])
+        hospital.admit_patient(patient, doctors[(i * 7 + 1) % doctor_count])
+    return hospital
+
+
+def build_lists(patient_count, doctor_count=100):
+    doctors = [ListDoctor(i, f"Doctor {i}", "General") for i in range(doctor_count)]
+    patients = []
+    for i in range(patient_count):
+        patient = Patient(i, f"Patient {i}", 30)
+        patients.append(patient)
+        doctors[i % doctor_count].add_patient(patient)
+        doctors[(i * 7 + 1) % doctor_count].add_patient(patient)
+    return doctors, patients
+
+
+def bench_hospital(patient_count=100_000, list_patient_count=20_000):
+    start = time.perf_counter()
+    hospital = build(patient_count)
+    elapsed = time.perf_counter() - start
+    print(f"indexed build, {patient_count} patients: {elapsed:.3f} s "
+          f"({2 * patient_count / elapsed:,.0f} admissions/s)")
+
+    # The list version is quadratic; time it at a smaller size, and at
+    # twice that to show the growth.
+    for count in (list_patient_count // 2, list_patient_count):
+        start = time.perf_counter()
+        build_lists(count)
+        elapsed = time.perf_counter() - start
+        print(f"list build, {count} patients: {elapsed:.3f} s "
+              f"({2 * count / elapsed:,.0f} admissions/s)")
+
+    start = time.perf_counter()
+    for i in range(patient_count):
+        hospital.doctors_treating(i)
+    elapsed = time.perf_counter() - start
+    print(f"patient -> doctors lookups: {elapsed:.3f} s ({patient_count / elapsed:,.0f} ops/s)")
+
+    start = time.perf_counter()
+    for i in range(0, patient_count, 2):
+        hospital.discharge_patient(i)
+    elapsed = time.perf_counter() - start
+    print(f"discharge {patient_count // 2} patients: {elapsed:.3f} s "
+          f"({patient_count // 2 / elapsed:,.0f} ops/s)")
+    assert sum(len(doctor.patients) for doctor in hospital.doctors.values()) == patient_count
+
+
+if __name__ == "__main__":
+    bench_hospital()
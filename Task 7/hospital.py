@@ -13,6 +13,8 @@ class Patient:
         self.name = name
         self.age = age
         self.medical_records = []
+        # Doctors treating this patient, kept up to date by Doctor.
+        self.doctors = {}
         
     def add_medical_record(self, record_id, diagnosis, treatment):
         record = MedicalRecord(record_id, diagnosis, treatment)
@@ -27,15 +29,19 @@ class Doctor:
         self.doctor_id = doctor_id
         self.name = name
         self.specialty = specialty
-        self.patients = []
+        # Dicts with None values serve as insertion-ordered sets: O(1)
+        # membership, adding and removal, iterated in the order added.
+        self.patients = {}
+        # Departments this doctor works in, kept up to date by Department.
+        self.departments = {}
         
     def add_patient(self, patient):
-        if patient not in self.patients:
-            self.patients.append(patient)
+        self.patients[patient] = None
+        patient.doctors[self] = None
             
     def remove_patient(self, patient):
-        if patient in self.patients:
-            self.patients.remove(patient)
+        self.patients.pop(patient, None)
+        patient.doctors.pop(self, None)
             
     def info(self):
         return f"Dr. {self.name} (Specialty: {self.specialty})"
@@ -43,62 +49,171 @@ class Doctor:
 class Department:
     def __init__(self, departmen_name):
         self.departmen_name = departmen_name
-        self.doctors = []
+        self.doctors = {}
         
     def add_doctor(self, doctor):
-        if doctor not in self.doctors:
-            self.doctors.append(doctor)
+        self.doctors[doctor] = None
+        doctor.departments[self] = None
             
     def remove_doctor(self, doctor):
-        if doctor in self.doctors:
-            self.doctors.remove(doctor)
+        self.doctors.pop(doctor, None)
+        doctor.departments.pop(self, None)
     
     def show_doctors(self):
         return f"Department: {self.departmen_name}, Doctors: {[doctor.name for doctor in self.doctors]}"
     
 class Hospital:
+    """Also the hospital-wide registry: departments by name, doctors by
+    doctor_id and patients by patient_id.
+
+    Add doctors and patients through add_doctor and admit_patient to keep
+    the ID indexes current. The links between patients, doctors and
+    departments, both ways, are kept by the objects themselves.
+    """
     def __init__(self, name):
         self.name = name
-        self.departments = []
+        # departmen_name -> Department, in the order added
+        self.departments = {}
+        self.doctors = {}
+        self.patients = {}
         
     def add_department(self, department):
-        if department not in self.departments:
-            self.departments.append(department)
+        if self._check_free(self.departments, department.departmen_name, department):
+            return
+        # Check the staff and patients it already has before changing
+        # anything, so a clashing ID leaves the registry as it was.
+        doctors, patients = self._check_staff(department.doctors)
+        self.departments[department.departmen_name] = department
+        self.doctors.update(doctors)
+        self.patients.update(patients)
             
     def remove_department(self, department):
-        if department in self.departments:
-            self.departments.remove(department)
-            
+        """Remove the department and unlink its doctors. Doctors left in
+        no other department of this hospital are removed as well."""
+        if self.departments.get(department.departmen_name) is not department:
+            return
+        del self.departments[department.departmen_name]
+        for doctor in list(department.doctors):
+            department.remove_doctor(doctor)
+            if not any(self.departments.get(other.departmen_name) is other
+                       for other in doctor.departments):
+                self.remove_doctor(doctor.doctor_id)
+
+    def add_doctor(self, doctor, department):
+        """Add the doctor, with the patients they already have, to the
+        department, adding the department too if it is new."""
+        new = not self._check_free(self.departments, department.departmen_name, department)
+        staff = list(department.doctors) if new else []
+        doctors, patients = self._check_staff(staff + [doctor])
+        if new:
+            self.departments[department.departmen_name] = department
+        self.doctors.update(doctors)
+        self.patients.update(patients)
+        department.add_doctor(doctor)
+
+    def admit_patient(self, patient, doctor):
+        self._check_free(self.doctors, doctor.doctor_id, doctor)
+        self._register(self.patients, patient.patient_id, patient)
+        self._register(self.doctors, doctor.doctor_id, doctor)
+        doctor.add_patient(patient)
+
+    def discharge_patient(self, patient_id):
+        patient = self.patients.pop(patient_id, None)
+        if patient is not None:
+            for doctor in list(patient.doctors):
+                doctor.remove_patient(patient)
+        return patient
+
+    def remove_doctor(self, doctor_id):
+        """Remove the doctor everywhere. Patients left with no doctor are
+        discharged."""
+        doctor = self.doctors.pop(doctor_id, None)
+        if doctor is not None:
+            for department in list(doctor.departments):
+                department.remove_doctor(doctor)
+            for patient in list(doctor.patients):
+                doctor.remove_patient(patient)
+                if not patient.doctors:
+                    self.patients.pop(patient.patient_id, None)
+        return doctor
+
+    def find_department(self, departmen_name):
+        return self.departments.get(departmen_name)
+
+    def find_doctor(self, doctor_id):
+        return self.doctors.get(doctor_id)
+
+    def find_patient(self, patient_id):
+        return self.patients.get(patient_id)
+
+    def doctors_treating(self, patient_id):
+        patient = self.patients.get(patient_id)
+        return list(patient.doctors) if patient else []
+
+    def departments_of(self, doctor_id):
+        doctor = self.doctors.get(doctor_id)
+        return list(doctor.departments) if doctor else []
+
     def show_departments(self):
-        return f"Hospital: {self.name}, Departments: {[department.departmen_name for department in self.departments]}"
+        return f"Hospital: {self.name}, Departments: {list(self.departments)}"
+
+    def _check_staff(self, doctors):
+        # The doctors and their patients by ID, checked against each other
+        # and the registry. Raises ValueError on a clash.
+        by_id = {}
+        patients = {}
+        for doctor in doctors:
+            self._register(by_id, doctor.doctor_id, doctor)
+            for patient in doctor.patients:
+                self._register(patients, patient.patient_id, patient)
+        for doctor_id, doctor in by_id.items():
+            self._check_free(self.doctors, doctor_id, doctor)
+        for patient_id, patient in patients.items():
+            self._check_free(self.patients, patient_id, patient)
+        return by_id, patients
+
+    @staticmethod
+    def _check_free(index, key, item):
+        # True if `item` is already registered under `key`.
+        existing = index.get(key)
+        if existing is not None and existing is not item:
+            raise ValueError(f"{key} already belongs to another {type(existing).__name__.lower()}.")
+        return existing is item
+
+    @staticmethod
+    def _register(index, key, item):
+        Hospital._check_free(index, key, item)
+        index[key] = item
     
 # Example
-hospital = Hospital("SekarHarum Hospital")
+if __name__ == "__main__":
+    hospital = Hospital("SekarHarum Hospital")
 
-dep1 = Department("Psychiatrist")
-dep2 = Department("Cardiology")
+    dep1 = Department("Psychiatrist")
+    dep2 = Department("Cardiology")
 
-hospital.add_department(dep1)
-hospital.add_department(dep2)
+    hospital.add_department(dep1)
+    hospital.add_department(dep2)
 
-doc1 = Doctor(1, "Dr. Ayep Setia Budi", "Psychiatrist")
-doc2 = Doctor(2, "Dr. Junaedi", "Cardiology")
+    doc1 = Doctor(1, "Dr. Ayep Setia Budi", "Psychiatrist")
+    doc2 = Doctor(2, "Dr. Junaedi", "Cardiology")
 
-dep1.add_doctor(doc1)
-dep2.add_doctor(doc2)
+    hospital.add_doctor(doc1, dep1)
+    hospital.add_doctor(doc2, dep2)
 
-pat1 = Patient(1, "Asep Goes", 20)
-pat2 = Patient(2, "Subagdja", 35)
+    pat1 = Patient(1, "Asep Goes", 20)
+    pat2 = Patient(2, "Subagdja", 35)
 
-doc1.add_patient(pat1)
-doc2.add_patient(pat2)
+    hospital.admit_patient(pat1, doc1)
+    hospital.admit_patient(pat2, doc2)
 
-pat1.add_medical_record(1, "Antidepresan", "Mood Stabilizer and Stimulan")
-pat2.add_medical_record(2, "Fever", "Rest and fluids")
+    pat1.add_medical_record(1, "Antidepresan", "Mood Stabilizer and Stimulan")
+    pat2.add_medical_record(2, "Fever", "Rest and fluids")
 
-print(hospital.show_departments())
-print(pat1.show_records())
-print(pat2.show_records())
-print(doc1.info())
-print(doc2.info())
-print(dep1.show_doctors())
+    print(hospital.show_departments())
+    print(pat1.show_records())
+    print(pat2.show_records())
+    print(doc1.info())
+    print(doc2.info())
+    print(dep1.show_doctors())
+    print(hospital.find_patient(2).name, [doctor.name for doctor in hospital.doctors_treating(2)])
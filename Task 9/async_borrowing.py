@@ -0,0 +1,109 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from custom_error_handling import RULES_REJECTED, BorrowResult, LibraryError, Rejection
+
+
+class AsyncBorrowPipeline:
+    """Borrowing for asyncio code, with the checks run side by side.
+
+    The availability, eligibility and membership checks do not depend on
+    each other, so they run concurrently and a request waits for the
+    slowest one rather than all three in turn. The rules service and
+    membership manager are ordinary blocking objects (possibly calling a
+    remote service), so their checks run in a thread pool. Nothing is
+    reserved until every check has passed; the stock and the member's
+    count are then committed, and the stock is put back if the member was
+    refused in the meantime. The commit runs as one call in the thread pool
+    and is shielded from cancellation: a borrow cancelled during it (by a
+    timeout, say) still completes or rolls back, so the stock and the
+    member's count always agree.
+
+    Failures raise the same LibraryError subclasses as borrow_book, and
+    when several checks fail the one borrow_book would have hit first is
+    reported: stock, then eligibility, then membership.
+
+    At most `max_in_flight` requests are processed at once; borrow() waits
+    for a free slot, and borrow_all() pulls requests from its iterable
+    only as slots free up.
+    """
+
+    def __init__(self, catalog, rules_service, max_in_flight=100, concurrent_checks=True):
+        self.catalog = catalog
+        self.rules_service = rules_service
+        self.max_in_flight = max_in_flight
+        # False runs the checks one after another, as borrow_book does.
+        self.concurrent_checks = concurrent_checks
+        self._slots = asyncio.Semaphore(max_in_flight)
+        # Two blocking checks per request at most.
+        self._executor = ThreadPoolExecutor(max_workers=2 * max_in_flight)
+
+    async def borrow(self, book_id, qty, member_id, membership_manager):
+        rejection = await self.try_borrow(book_id, qty, member_id, membership_manager)
+        if rejection is not None:
+            raise rejection.error()
+
+    async def try_borrow(self, book_id, qty, member_id, membership_manager):
+        """Like borrow, but returns None or a Rejection instead of raising."""
+        async with self._slots:
+            checks = (lambda: self._check_availability(book_id, qty),
+                      lambda: self._check_eligibility(member_id),
+                      lambda: self._run(membership_manager.check_authorize, qty))
+            if self.concurrent_checks:
+                rejections = await asyncio.gather(*(check() for check in checks))
+            else:
+                rejections = []
+                for check in checks:
+                    rejections.append(await check())
+                    if rejections[-1] is not None:
+                        # Skip the remaining checks, as borrow_book would.
+                        break
+            for rejection in rejections:
+                if rejection is not None:
+                    return rejection
+
+            # Every check passed: commit.
+            return await asyncio.shield(self._run(self._commit, book_id, qty, membership_manager))
+
+    async def borrow_all(self, requests, members):
+        """Borrow for (book_id, qty, member_id) requests; returns a
+        BorrowResult per request, in order. `members` maps member_id to
+        its MembershipManager."""
+        requests = enumerate(requests)
+        results = {}
+
+        async def worker():
+            # Workers share the iterator, so requests are only read when
+            # there is a slot for them.
+            for index, (book_id, qty, member_id) in requests:
+                rejection = await self.try_borrow(book_id, qty, member_id, members[member_id])
+                results[index] = BorrowResult(book_id, qty, member_id, rejection)
+
+        await asyncio.gather(*(worker() for _ in range(self.max_in_flight)))
+        return [results[index] for index in range(len(results))]
+
+    def close(self):
+        self._executor.shutdown()
+
+    def _commit(self, book_id, qty, membership_manager):
+        # Either step can still fail if a concurrent request got there first.
+        rejection = self.catalog.try_reserve(book_id, qty)
+        if rejection is None:
+            rejection = membership_manager.try_authorize(qty)
+            if rejection is not None:
+                self.catalog._put_back(book_id, qty)
+        return rejection
+
+    async def _check_availability(self, book_id, qty):
+        # In memory; no need for a thread.
+        return self.catalog.check_reserve(book_id, qty)
+
+    async def _check_eligibility(self, member_id):
+        try:
+            await self._run(self.rules_service.check_eligibility, member_id)
+        except LibraryError as e:
+            return Rejection(RULES_REJECTED, error=e)
+        return None
+
+    def _run(self, function, *args):
+        return asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
@@ -0,0 +1,67 @@
+import asyncio
+import random
+import statistics
+import time
+
+from async_borrowing import AsyncBorrowPipeline
+from custom_error_handling import LibraryCatalog, LibraryRulesService, LocalRulesBackend, MembershipManager
+
+
+class RemoteMembershipManager(MembershipManager):
+    """Membership checks that wait on a simulated remote service."""
+
+    def __init__(self, latency, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latency = latency
+
+    def check_authorize(self, quantity):
+        time.sleep(self.latency)
+        return super().check_authorize(quantity)
+
+
+def make_state(books, members, latency, seed=1):
+    rng = random.Random(seed)
+    catalog = LibraryCatalog({f"BOOK{i:04d}": rng.randint(0, 30) for i in range(books)})
+    managers = {f"MEM{i:04d}": RemoteMembershipManager(latency, is_active=rng.random() < 0.95,
+                                                       borrowed_books=0, limit=rng.randint(3, 15))
+                for i in range(members)}
+    return catalog, managers
+
+
+async def run(concurrent_checks, requests, latency, max_in_flight, books, members):
+    catalog, managers = make_state(books, members, latency)
+    blocked = {f"MEM{i:04d}" for i in range(0, members, 20)}
+    rules = LibraryRulesService(LocalRulesBackend(latency, blocked))
+    pipeline = AsyncBorrowPipeline(catalog, rules, max_in_flight, concurrent_checks)
+    latencies = []
+    pending = iter(requests)
+
+    async def worker():
+        for book_id, qty, member_id in pending:
+            start = time.perf_counter()
+            await pipeline.try_borrow(book_id, qty, member_id, managers[member_id])
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max_in_flight)))
+    elapsed = time.perf_counter() - start
+    pipeline.close()
+    return elapsed, latencies, catalog.stock
+
+
+def bench_async(count=5000, latency=0.02, max_in_flight=100, books=500, members=2000, seed=2):
+    rng = random.Random(seed)
+    requests = [(f"BOOK{rng.randrange(books):04d}", rng.randint(1, 2), f"MEM{rng.randrange(members):04d}")
+                for _ in range(count)]
+    print(f"{count:,} requests, {max_in_flight} in flight, {latency * 1000:.0f} ms simulated "
+          f"rules and membership backends")
+    for label, concurrent in (("Checks in turn", False), ("Concurrent checks", True)):
+        elapsed, latencies, _ = asyncio.run(run(concurrent, requests, latency, max_in_flight,
+                                                books, members))
+        cuts = statistics.quantiles(latencies, n=100)
+        print(f"{label + ':':<19} p50 {cuts[49] * 1000:6.1f} ms, p99 {cuts[98] * 1000:6.1f} ms, "
+              f"{count / elapsed:,.0f} requests/s")
+
+
+if __name__ == "__main__":
+    bench_async()
@@ -0,0 +1,54 @@
+import contextlib
+import os
+import random
+import time
+from collections import Counter
+
+from custom_error_handling import (LibraryCatalog, LibraryRulesService, MembershipManager,
+                                   borrow_batch, borrow_book)
+
+
+def make_state(books, members, seed=1):
+    rng = random.Random(seed)
+    catalog = LibraryCatalog({f"BOOK{i:05d}": rng.randint(0, 400) for i in range(books)})
+    managers = {f"MEM{i:05d}": MembershipManager(is_active=rng.random() < 0.95, borrowed_books=0,
+                                                 limit=10_000)
+                for i in range(members)}
+    return catalog, managers
+
+
+def make_requests(count, books, members, seed=2):
+    rng = random.Random(seed)
+    return [(f"BOOK{rng.randrange(books):05d}", rng.randint(1, 3), f"MEM{rng.randrange(members):05d}")
+            for _ in range(count)]
+
+
+def bench_batch(count=200_000, books=2000, members=5000):
+    requests = make_requests(count, books, members)
+    rules = LibraryRulesService()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        catalog, managers = make_state(books, members)
+        start = time.perf_counter()
+        for book_id, qty, member_id in requests:
+            borrow_book(book_id, qty, member_id, catalog, managers[member_id], rules)
+        loop = time.perf_counter() - start
+        loop_state = (dict(catalog.stock), {m: manager.borrowed_books for m, manager in managers.items()})
+
+        catalog, managers = make_state(books, members)
+        start = time.perf_counter()
+        results = borrow_batch(requests, catalog, managers, rules)
+        batch = time.perf_counter() - start
+        batch_state = (dict(catalog.stock), {m: manager.borrowed_books for m, manager in managers.items()})
+
+    outcomes = Counter('succeeded' if result.succeeded else type(result.error).__name__
+                       for result in results)
+    print(f"{count:,} requests over {books:,} books and {members:,} members")
+    print(f"borrow_book loop: {loop:.2f} s ({count / loop:,.0f} requests/s)")
+    print(f"borrow_batch:     {batch:.2f} s ({count / batch:,.0f} requests/s)")
+    print(f"Outcomes: {dict(outcomes)}")
+    print(f"Same final stock and member totals as the loop: {loop_state == batch_state}")
+
+
+if __name__ == "__main__":
+    bench_batch()
@@ -0,0 +1,104 @@
+import contextlib
+import os
+import random
+import time
+from collections import Counter
+
+from custom_error_handling import (LibraryCatalog, LibraryError, LibraryRulesService,
+                                   MembershipManager, try_borrow)
+
+
+class QuietRulesService(LibraryRulesService):
+    # The placeholder prints on every call; keep it out of the timings.
+    def check_eligibility(self, member_id):
+        pass
+
+
+def make_state(books, members, seed=1):
+    rng = random.Random(seed)
+    catalog = LibraryCatalog({f"BOOK{i:04d}": rng.randint(0, 180) for i in range(books)})
+    managers = [MembershipManager(is_active=rng.random() < 0.97, borrowed_books=0,
+                                  limit=rng.randint(2, 12)) for _ in range(members)]
+    return catalog, managers
+
+
+def raising_borrow(book_id, qty, member_id, catalog, membership_manager, rules_service):
+    # borrow_book's steps through the exception API, minus its own prints.
+    catalog.reserve(book_id, qty)
+    try:
+        rules_service.check_eligibility(member_id)
+        membership_manager.authorize(qty)
+    except LibraryError:
+        catalog._put_back(book_id, qty)
+        raise
+
+
+def run_raising(requests, keep):
+    catalog, managers = make_state(*STATE)
+    rules = QuietRulesService()
+    errors = []
+    rejected = 0
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for book_id, qty, member in requests:
+            try:
+                raising_borrow(book_id, qty, member, catalog, managers[member], rules)
+            except LibraryError as e:
+                rejected += 1
+                if keep:
+                    errors.append(e)
+        elapsed = time.perf_counter() - start
+    return elapsed, rejected, errors, catalog.stock
+
+
+def run_codes(requests, keep):
+    catalog, managers = make_state(*STATE)
+    rules = QuietRulesService()
+    rejections = []
+    rejected = 0
+    start = time.perf_counter()
+    for book_id, qty, member in requests:
+        rejection = try_borrow(book_id, qty, member, catalog, managers[member], rules)
+        if rejection is not None:
+            rejected += 1
+            if keep:
+                rejections.append(rejection)
+    elapsed = time.perf_counter() - start
+    return elapsed, rejected, rejections, catalog.stock
+
+
+# (books, members) for every run
+STATE = (1000, 20_000)
+
+
+def bench_rejections(count=500_000, seed=2):
+    rng = random.Random(seed)
+    books, members = STATE
+    requests = [(f"BOOK{rng.randrange(books):04d}", rng.randint(1, 3), rng.randrange(members))
+                for _ in range(count)]
+
+    timings = {}
+    for keep in (False, True):
+        timings['Exception API', keep] = run_raising(requests, keep)
+        timings['Result codes', keep] = run_codes(requests, keep)
+
+    _, rejected, errors, raising_stock = timings['Exception API', True]
+    _, _, rejections, codes_stock = timings['Result codes', True]
+    # Messages are built only for the rejections someone looks at.
+    start = time.perf_counter()
+    shown = [rejection.message for rejection in rejections[:len(rejections) // 100]]
+    formatting = time.perf_counter() - start
+
+    kinds = Counter(type(e).__name__ for e in errors)
+    print(f"{count:,} requests, {rejected / count:.0%} rejected: {dict(kinds)}")
+    for (name, keep), (elapsed, _, _, _) in timings.items():
+        label = f"{name}, {'keeping' if keep else 'counting'} rejections:"
+        print(f"{label:<42} {elapsed:.2f} s ({count / elapsed:,.0f} requests/s)")
+    print(f"Formatting 1% of the messages afterwards: {formatting * 1000:.1f} ms")
+    same = (len(errors) == len(rejections) and raising_stock == codes_stock
+            and [str(e) for e in errors[:len(shown)]] == shown)
+    print(f"Same outcomes and messages: {same}")
+
+
+if __name__ == "__main__":
+    bench_rejections()
@@ -0,0 +1,52 @@
+import random
+import threading
+import time
+
+from custom_error_handling import (EligibilityCache, LibraryError, LibraryRulesService,
+                                   LocalRulesBackend)
+
+
+def run(service, threads, checks, members, seed):
+    def worker(worker_seed):
+        rng = random.Random(worker_seed)
+        for _ in range(checks):
+            # A few members borrow far more often than the rest.
+            member_id = f"MEM{int(rng.paretovariate(1.2)) % members:05d}"
+            try:
+                service.check_eligibility(member_id)
+            except LibraryError:
+                pass
+
+    pool = [threading.Thread(target=worker, args=(seed + n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def bench_rules_cache(threads=32, checks=200, members=2000, latency=0.01, seed=1):
+    blocked = {f"MEM{i:05d}" for i in range(0, members, 10)}
+    total = threads * checks
+
+    backend = LocalRulesBackend(latency, blocked)
+    uncached = run(LibraryRulesService(backend), threads, checks, members, seed)
+    uncached_calls = backend.calls
+
+    backend = LocalRulesBackend(latency, blocked)
+    cache = EligibilityCache(backend, ttl=60, negative_ttl=10, max_entries=members)
+    cached = run(LibraryRulesService(cache), threads, checks, members, seed)
+
+    stats = cache.stats()
+    print(f"{threads} threads x {checks} checks, backend latency {latency * 1000:.0f} ms")
+    print(f"No cache:   {uncached:.2f} s ({total / uncached:,.0f} checks/s), "
+          f"{uncached_calls:,} backend calls")
+    print(f"With cache: {cached:.2f} s ({total / cached:,.0f} checks/s), "
+          f"{backend.calls:,} backend calls")
+    print(f"Hits {stats['hits']:,}, misses {stats['misses']:,}, "
+          f"coalesced {stats['coalesced']:,}, cached members {stats['entries']:,}")
+
+
+if __name__ == "__main__":
+    bench_rules_cache()
@@ -1,3 +1,9 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
 # Custom Exceptions
 class LibraryError(Exception):
     """Base class for library system errors."""
@@ -22,58 +28,437 @@ class BorrowLimitExceededError(LibraryError):
         message = f"Borrow limit exceeded. Max allowed: {limit} books."
         super().__init__(message)
 
+class MemberNotEligibleError(LibraryError):
+    """Raised when the rules service refuses a member."""
+    def __init__(self, member_id, reason):
+        message = f"Member {member_id} is not eligible to borrow books: {reason}."
+        super().__init__(message)
+
+
+# Result codes for the exception-free checks
+NOT_AVAILABLE = 1
+MEMBERSHIP_EXPIRED = 2
+LIMIT_EXCEEDED = 3
+RULES_REJECTED = 4
+
+ERROR_TYPES = {
+    NOT_AVAILABLE: BookNotAvailableError,
+    MEMBERSHIP_EXPIRED: MembershipExpiredError,
+    LIMIT_EXCEEDED: BorrowLimitExceededError,
+    RULES_REJECTED: MemberNotEligibleError,
+}
+
+
+class Rejection:
+    """Why a check failed: a result code and the details for its message.
+
+    The try_* methods return this instead of raising, since building and
+    raising an exception costs far more than the check itself. The
+    exception and its message are only built if someone asks for them.
+    """
+    __slots__ = ('code', 'details', '_error')
+
+    def __init__(self, code, details=(), error=None):
+        self.code = code
+        self.details = details
+        # An exception that already exists, e.g. one the rules service raised.
+        self._error = error
+
+    def error(self):
+        if self._error is not None:
+            return self._error
+        return ERROR_TYPES[self.code](*self.details)
+
+    @property
+    def message(self):
+        return str(self.error())
+
+
+EXPIRED = Rejection(MEMBERSHIP_EXPIRED)
+
 
 # System Components
 class LibraryCatalog:
     def __init__(self, stock):
         # stock: dict mapping book_id to quantity available
         self.stock = stock
+        # One lock per book, so threads reserving different titles never
+        # wait for each other.
+        self._locks = {book_id: threading.Lock() for book_id in stock}
+        self._locks_guard = threading.Lock()
 
     def reserve(self, book_id, quantity):
+        rejection = self.try_reserve(book_id, quantity)
+        if rejection is not None:
+            raise rejection.error()
+        print(f"[Catalog] Reserved {quantity} copy/copies of {book_id}.")
+
+    def try_reserve(self, book_id, quantity):
+        """Like reserve, but returns a Rejection instead of raising (None
+        on success) and prints nothing."""
+        with self._lock_for(book_id):
+            available = self.stock.get(book_id, 0)
+            if quantity > available:
+                return Rejection(NOT_AVAILABLE, (book_id, quantity, available))
+            self.stock[book_id] = available - quantity
+        return None
+
+    def check_reserve(self, book_id, quantity):
+        """The Rejection try_reserve would give right now, without
+        reserving anything."""
         available = self.stock.get(book_id, 0)
         if quantity > available:
-            raise BookNotAvailableError(book_id, quantity, available)
-        self.stock[book_id] -= quantity
-        print(f"[Catalog] Reserved {quantity} copy/copies of {book_id}.")
+            return Rejection(NOT_AVAILABLE, (book_id, quantity, available))
+        return None
+
+    def reserve_many(self, items):
+        """Reserve several books at once; items maps book_id to quantity.
+        Either every book is reserved or, if one is short, none is."""
+        # Locks are always taken in book_id order, so two overlapping
+        # reservations cannot each hold a lock the other is waiting for.
+        book_ids = sorted(items)
+        locks = [self._lock_for(book_id) for book_id in book_ids]
+        for lock in locks:
+            lock.acquire()
+        try:
+            for book_id in book_ids:
+                available = self.stock.get(book_id, 0)
+                if items[book_id] > available:
+                    raise BookNotAvailableError(book_id, items[book_id], available)
+            for book_id in book_ids:
+                self.stock[book_id] -= items[book_id]
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+        print(f"[Catalog] Reserved {sum(items.values())} copy/copies of {len(items)} book(s).")
+
+    def release(self, book_id, quantity):
+        """Put reserved copies back, e.g. when a later check fails."""
+        self._put_back(book_id, quantity)
+        print(f"[Catalog] Released {quantity} copy/copies of {book_id}.")
+
+    def release_many(self, items):
+        for book_id, quantity in items.items():
+            self.release(book_id, quantity)
+
+    def _put_back(self, book_id, quantity):
+        with self._lock_for(book_id):
+            self.stock[book_id] = self.stock.get(book_id, 0) + quantity
+
+    def _lock_for(self, book_id):
+        lock = self._locks.get(book_id)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(book_id, threading.Lock())
+        return lock
 
 class MembershipManager:
-    def __init__(self, is_active, borrowed_books, limit):
+    def __init__(self, is_active, borrowed_books, limit, member_id=None, rules_service=None):
         self.is_active = is_active
         self.borrowed_books = borrowed_books
         self.limit = limit
+        # Told about membership changes so it drops cached eligibility.
+        self.member_id = member_id
+        self.rules_service = rules_service
+        self._lock = threading.Lock()
+
+    def update(self, is_active=None, limit=None):
+        """Renew, expire or change the limit of the membership."""
+        with self._lock:
+            if is_active is not None:
+                self.is_active = is_active
+            if limit is not None:
+                self.limit = limit
+        if self.rules_service is not None:
+            self.rules_service.invalidate(self.member_id)
 
     def authorize(self, quantity):
+        rejection = self.try_authorize(quantity)
+        if rejection is not None:
+            raise rejection.error()
+        print(f"[Membership] Authorized borrowing of {quantity} book(s). Now borrowed: {self.borrowed_books}.")
+
+    def check_authorize(self, quantity):
+        """The Rejection try_authorize would give right now, without
+        authorizing anything."""
         if not self.is_active:
-            raise MembershipExpiredError()
+            return EXPIRED
         if self.borrowed_books + quantity > self.limit:
-            raise BorrowLimitExceededError(self.limit)
-        self.borrowed_books += quantity
-        print(f"[Membership] Authorized borrowing of {quantity} book(s). Now borrowed: {self.borrowed_books}.")
+            return Rejection(LIMIT_EXCEEDED, (self.limit,))
+        return None
+
+    def try_authorize(self, quantity):
+        """Like authorize, but returns a Rejection instead of raising (None
+        on success) and prints nothing."""
+        with self._lock:
+            if not self.is_active:
+                return EXPIRED
+            if self.borrowed_books + quantity > self.limit:
+                return Rejection(LIMIT_EXCEEDED, (self.limit,))
+            self.borrowed_books += quantity
+        return None
 
 class LibraryRulesService:
+    """Asks a rules backend whether a member may borrow. Without a
+    backend every member is eligible."""
+    def __init__(self, backend=None):
+        self.backend = backend
+
     def check_eligibility(self, member_id):
-        # Placeholder logic
+        """Raise MemberNotEligibleError if the member may not borrow.
+        Prints nothing; borrow_book reports the result."""
+        if self.backend is None:
+            # Placeholder logic
+            return
+        reason = self.backend.check(member_id)
+        if reason is not None:
+            raise MemberNotEligibleError(member_id, reason)
+
+    def invalidate(self, member_id):
+        """Call when a member's membership changes."""
+        if hasattr(self.backend, 'invalidate'):
+            self.backend.invalidate(member_id)
+
+
+# Rules Backends
+class RulesBackend:
+    """Interface for the service that decides who may borrow."""
+    def check(self, member_id):
+        """Return None if the member may borrow, else the reason why not."""
+        raise NotImplementedError
+
+
+class LocalRulesBackend(RulesBackend):
+    """In-process stand-in for the remote rules service. Each call sleeps
+    for `latency` seconds like a network round trip; members in `blocked`
+    are refused."""
+    def __init__(self, latency=0.05, blocked=()):
+        self.latency = latency
+        self.blocked = set(blocked)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def check(self, member_id):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        if member_id in self.blocked:
+            return "account suspended"
+        return None
+
+
+class EligibilityCache(RulesBackend):
+    """TTL and LRU cache in front of another rules backend.
+
+    Answers are kept for `ttl` seconds and refusals for `negative_ttl`
+    seconds, with at most `max_entries` members; the least recently used
+    go first. Threads that ask about the same uncached member at the same
+    time share one backend call. invalidate() drops a member's answer,
+    including one still on its way back from the backend.
+    """
+
+    def __init__(self, backend, ttl=300, negative_ttl=30, max_entries=10_000,
+                 clock=time.monotonic):
+        self.backend = backend
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        # member_id -> (reason, expires_at), least recently used first.
+        self._entries = OrderedDict()
+        # member_id -> Future for the backend call in flight.
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def check(self, member_id):
+        with self._lock:
+            entry = self._entries.get(member_id)
+            if entry is not None:
+                if entry[1] > self.clock():
+                    self._entries.move_to_end(member_id)
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[member_id]
+            future = self._pending.get(member_id)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = self._pending[member_id] = Future()
+            else:
+                self.coalesced += 1
+        if not owner:
+            return future.result()
+
+        try:
+            reason = self.backend.check(member_id)
+        except BaseException as e:
+            with self._lock:
+                if self._pending.get(member_id) is future:
+                    del self._pending[member_id]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            # Not stored if invalidate() ran while the backend was answering.
+            if self._pending.get(member_id) is future:
+                del self._pending[member_id]
+                ttl = self.ttl if reason is None else self.negative_ttl
+                self._entries[member_id] = (reason, self.clock() + ttl)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        future.set_result(reason)
+        return reason
+
+    def invalidate(self, member_id):
+        with self._lock:
+            self._entries.pop(member_id, None)
+            self._pending.pop(member_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'coalesced': self.coalesced,
+                    'entries': len(self._entries)}
+
+
+class BorrowResult:
+    """Outcome of one request in a batch; `rejection` says why it was
+    refused, or is None if it succeeded."""
+    def __init__(self, book_id, quantity, member_id, rejection=None):
+        self.book_id = book_id
+        self.quantity = quantity
+        self.member_id = member_id
+        self.rejection = rejection
+
+    @property
+    def succeeded(self):
+        return self.rejection is None
+
+    @property
+    def error(self):
+        # The LibraryError that refused the request, built on demand.
+        return None if self.rejection is None else self.rejection.error()
+
+
+# Book Borrowing Functions
+def borrow_books(items, member_id, catalog, membership_manager, rules_service):
+    """Borrow several books (book_id -> quantity) as one transaction.
+
+    Raises a LibraryError if any book is short or any check fails, after
+    putting back every copy it reserved.
+    """
+    # 1. Check book availability
+    catalog.reserve_many(items)
+    try:
+        # 2. Check member eligibility
+        rules_service.check_eligibility(member_id)
         print(f"[Rules] Member {member_id} is eligible to borrow books.")
 
+        # 3. Authorize borrowing
+        membership_manager.authorize(sum(items.values()))
+    except BaseException:
+        # Roll back the reservation, whatever went wrong.
+        catalog.release_many(items)
+        raise
+
+
+def borrow_batch(requests, catalog, members, rules_service):
+    """Borrow for many (book_id, qty, member_id) requests; returns one
+    BorrowResult per request, in request order, and prints nothing itself.
+
+    Eligibility is checked once per member. Requests are then grouped by
+    book_id, and each book's stock is read, updated and written back once
+    under a single hold of its lock. Within a book, requests are decided
+    in order, with the same checks and error precedence as borrow_book.
+    `members` maps member_id to that member's MembershipManager.
+    Across books, requests are decided one book at a time, in the order
+    each book first appears. This differs from calling borrow_book in a
+    loop only when a member's borrow limit runs out part way through a
+    batch.
+    """
+    requests = list(requests)
+    results = [None] * len(requests)
+    # Look every member up first, so an unknown member_id fails the batch
+    # before anything has changed.
+    managers = {member_id: members[member_id] for _, _, member_id in requests}
+
+    eligibility = {}
+    for _, _, member_id in requests:
+        if member_id not in eligibility:
+            try:
+                rules_service.check_eligibility(member_id)
+                eligibility[member_id] = None
+            except LibraryError as e:
+                eligibility[member_id] = Rejection(RULES_REJECTED, error=e)
+
+    groups = {}
+    for index, request in enumerate(requests):
+        groups.setdefault(request[0], []).append(index)
+
+    for book_id, indexes in groups.items():
+        with catalog._lock_for(book_id):
+            available = catalog.stock.get(book_id, 0)
+            try:
+                for index in indexes:
+                    _, qty, member_id = requests[index]
+                    if qty > available:
+                        rejection = Rejection(NOT_AVAILABLE, (book_id, qty, available))
+                    else:
+                        rejection = eligibility[member_id]
+                        if rejection is None:
+                            rejection = managers[member_id].try_authorize(qty)
+                            if rejection is None:
+                                available -= qty
+                    results[index] = BorrowResult(book_id, qty, member_id, rejection)
+            finally:
+                # Members already charged keep their books even if a later
+                # request in the group raises.
+                if book_id in catalog.stock:
+                    catalog.stock[book_id] = available
+    return results
+
+
+def try_borrow(book_id, qty, member_id, catalog, membership_manager, rules_service):
+    """borrow_book without exceptions or printing: returns None on success
+    or the Rejection of the first check that failed, with the stock put
+    back."""
+    rejection = catalog.try_reserve(book_id, qty)
+    if rejection is not None:
+        return rejection
+    try:
+        rules_service.check_eligibility(member_id)
+    except LibraryError as e:
+        rejection = Rejection(RULES_REJECTED, error=e)
+    else:
+        rejection = membership_manager.try_authorize(qty)
+    if rejection is not None:
+        catalog._put_back(book_id, qty)
+    return rejection
+
 
-# Book Borrowing Function
 def borrow_book(book_id, qty, member_id,
                 catalog, membership_manager, rules_service):
     try:
         # 1. Check book availability
         catalog.reserve(book_id, qty)
+        try:
+            # 2. Check member eligibility
+            rules_service.check_eligibility(member_id)
+            print(f"[Rules] Member {member_id} is eligible to borrow books.")
 
-        # 2. Check member eligibility
-        rules_service.check_eligibility(member_id)
+            # 3. Authorize borrowing
+            membership_manager.authorize(qty)
+        except BaseException:
+            catalog.release(book_id, qty)
+            raise
 
-        # 3. Authorize borrowing
-        membership_manager.authorize(qty)
-
-    except BookNotAvailableError as e:
-        print(f"Borrowing failed: {e}")
-    except MembershipExpiredError as e:
-        print(f"Borrowing failed: {e}")
-    except BorrowLimitExceededError as e:
+    except LibraryError as e:
         print(f"Borrowing failed: {e}")
     else:
         print("Book borrowing succeeded! Enjoy reading.")
@@ -128,3 +513,10 @@ if __name__ == "__main__":
         membership_manager=member_limit,
         rules_service=rules
     )
+
+    # 5. Several books at once: all or nothing
+    try:
+        borrow_books({"BOOK123": 1, "BOOK999": 1}, "MEM001", catalog, member, rules)
+    except LibraryError as e:
+        print(f"Borrowing failed: {e}")
+    print(f"Stock after the failed multi-book borrow: {catalog.stock}")
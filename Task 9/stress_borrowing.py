@@ -0,0 +1,97 @@
+import contextlib
+import os
+import random
+import threading
+import time
+
+from custom_error_handling import (BorrowLimitExceededError, LibraryCatalog, LibraryError,
+                                   LibraryRulesService, MembershipManager, borrow_books)
+
+
+class FlakyRulesService(LibraryRulesService):
+    """Rejects some members after their books are already reserved, so the
+    rollback path runs often."""
+
+    def __init__(self, rejection_rate, seed):
+        self.rejection_rate = rejection_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def check_eligibility(self, member_id):
+        with self.lock:
+            rejected = self.rng.random() < self.rejection_rate
+        if rejected:
+            raise BorrowLimitExceededError(0)
+
+
+def stress(threads=16, requests=5000, books=50, members=200, seed=1):
+    rng = random.Random(seed)
+    initial = {f"BOOK{i:03d}": rng.randint(0, 2000) for i in range(books)}
+    catalog = LibraryCatalog(dict(initial))
+    managers = [MembershipManager(is_active=rng.random() < 0.9, borrowed_books=0,
+                                  limit=rng.randint(50, 400)) for _ in range(members)]
+    rules = FlakyRulesService(0.1, seed)
+    borrowed = []
+    negative = []
+    done = threading.Event()
+
+    def worker(worker_seed):
+        worker_rng = random.Random(worker_seed)
+        mine = []
+        for _ in range(requests):
+            items = {}
+            for _ in range(worker_rng.randint(1, 4)):
+                book_id = f"BOOK{worker_rng.randrange(books):03d}"
+                items[book_id] = items.get(book_id, 0) + worker_rng.randint(1, 3)
+            member = worker_rng.randrange(members)
+            try:
+                borrow_books(items, member, catalog, managers[member], rules)
+            except LibraryError:
+                continue
+            mine.append((member, items))
+        borrowed.extend(mine)
+
+    def monitor():
+        # Stock must never go negative, even for a moment.
+        while not done.is_set():
+            negative.extend(book_id for book_id, quantity in list(catalog.stock.items())
+                            if quantity < 0)
+            time.sleep(0.001)
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        watcher = threading.Thread(target=monitor)
+        watcher.start()
+        pool = [threading.Thread(target=worker, args=(seed + n,)) for n in range(threads)]
+        start = time.perf_counter()
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        done.set()
+        watcher.join()
+
+    out = {book_id: 0 for book_id in initial}
+    per_member = [0] * members
+    for member, items in borrowed:
+        for book_id, quantity in items.items():
+            out[book_id] += quantity
+            per_member[member] += quantity
+
+    conserved = all(catalog.stock[book_id] + out[book_id] == initial[book_id] for book_id in initial)
+    members_match = all(manager.borrowed_books == per_member[number]
+                        for number, manager in enumerate(managers))
+    within_limits = all(manager.borrowed_books <= manager.limit for manager in managers)
+
+    print(f"{threads} threads x {requests} multi-book borrows in {elapsed:.2f} s "
+          f"({threads * requests / elapsed:,.0f} borrows/s)")
+    print(f"Succeeded: {len(borrowed):,}, failed and rolled back: {threads * requests - len(borrowed):,}")
+    print(f"Stock + borrowed copies == initial stock for every book: {conserved}")
+    print(f"Member totals match their successful borrows: {members_match}")
+    print(f"No member over their limit: {within_limits}")
+    print(f"Negative stock ever observed: {bool(negative)}")
+    return conserved and members_match and within_limits and not negative
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if stress() else 1)
@@ -0,0 +1,95 @@
+import asyncio
+import random
+import threading
+import time
+
+from async_borrowing import AsyncBorrowPipeline
+from custom_error_handling import (LIMIT_EXCEEDED, LibraryCatalog, LibraryRulesService,
+                                   MembershipManager, Rejection)
+
+
+class SlowMembershipManager(MembershipManager):
+    """Authorizes after a delay, long enough for a borrow to be cancelled
+    while it waits, and refuses a share of the members that passed the
+    check, as if their limit changed in the meantime."""
+
+    def __init__(self, delay, refuse_rate, seed, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delay = delay
+        self.refuse_rate = refuse_rate
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+    def try_authorize(self, quantity):
+        with self.rng_lock:
+            delay = self.rng.uniform(self.delay / 2, self.delay)
+            refused = self.rng.random() < self.refuse_rate
+        time.sleep(delay)
+        if refused:
+            return Rejection(LIMIT_EXCEEDED, (self.limit,))
+        return super().try_authorize(quantity)
+
+
+async def cancel_one():
+    # A refused borrow cancelled while the refusal is on its way.
+    catalog = LibraryCatalog({"BOOK": 5})
+    member = SlowMembershipManager(0.4, 1.0, 0, is_active=True, borrowed_books=0, limit=10)
+    pipeline = AsyncBorrowPipeline(catalog, LibraryRulesService())
+    try:
+        await asyncio.wait_for(pipeline.try_borrow("BOOK", 2, "MEM", member), timeout=0.1)
+        cancelled = False
+    except asyncio.TimeoutError:
+        cancelled = True
+    pipeline.close()
+    return cancelled, catalog.stock["BOOK"], member.borrowed_books
+
+
+async def cancel_many(requests, books, members, seed):
+    rng = random.Random(seed)
+    initial = {f"BOOK{i:03d}": rng.randint(0, 20) for i in range(books)}
+    catalog = LibraryCatalog(dict(initial))
+    managers = {f"MEM{i:03d}": SlowMembershipManager(0.04, 0.2, seed + i, is_active=True,
+                                                     borrowed_books=0, limit=rng.randint(2, 10))
+                for i in range(members)}
+    pipeline = AsyncBorrowPipeline(catalog, LibraryRulesService(), max_in_flight=50)
+    outcomes = {'completed': 0, 'cancelled': 0}
+    pending = iter([(f"BOOK{rng.randrange(books):03d}", rng.randint(1, 3),
+                     f"MEM{rng.randrange(members):03d}", rng.uniform(0.02, 0.04))
+                    for _ in range(requests)])
+
+    async def worker():
+        # Timeouts fall inside the 20-40 ms authorize delay, so many
+        # borrows are cancelled part way through their commit.
+        for book_id, qty, member_id, timeout in pending:
+            try:
+                await asyncio.wait_for(
+                    pipeline.try_borrow(book_id, qty, member_id, managers[member_id]), timeout)
+                outcomes['completed'] += 1
+            except asyncio.TimeoutError:
+                outcomes['cancelled'] += 1
+
+    await asyncio.gather(*(worker() for _ in range(pipeline.max_in_flight)))
+    # Waits for commits that were still running when their borrow was cancelled.
+    pipeline.close()
+
+    lent = sum(initial[book_id] - catalog.stock[book_id] for book_id in initial)
+    charged = sum(manager.borrowed_books for manager in managers.values())
+    return outcomes, lent, charged
+
+
+def stress(requests=2000, books=20, members=100, seed=1):
+    cancelled, stock, charged = asyncio.run(cancel_one())
+    one_ok = cancelled and stock == 5 and charged == 0
+    print(f"Refused borrow cancelled in flight: cancelled={cancelled}, "
+          f"stock 5 -> {stock}, member charged {charged}")
+
+    outcomes, lent, charged = asyncio.run(cancel_many(requests, books, members, seed))
+    print(f"{requests:,} borrows with random timeouts: {outcomes['completed']:,} completed, "
+          f"{outcomes['cancelled']:,} cancelled")
+    print(f"Copies taken from stock: {lent:,}, copies charged to members: {charged:,}")
+    print(f"Stock and member counts agree: {one_ok and lent == charged}")
+    return one_ok and lent == charged
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if stress() else 1)
@@ -0,0 +1,171 @@
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+
+from variants import ROOT, bank_variants
+from account_registry import AccountRegistry
+
+RESULTS = os.path.join(ROOT, 'benchmarks', 'results', 'bank_accounts.json')
+
+
+def best_of(repeat, func):
+    # Smallest of `repeat` timings; the least disturbed run.
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_creation(variant, count, repeat):
+    elapsed = best_of(repeat, lambda: [variant.factory(number, 1000)
+                                       for number in range(1, count + 1)])
+    return {'accounts_per_sec': round(count / elapsed)}
+
+
+def bench_transactions(variant, count, repeat):
+    accounts = [variant.factory(number, 1000) for number in range(1, 101)]
+    deposit = [getattr(account, variant.deposit_method) for account in accounts]
+    withdraw = [getattr(account, variant.withdraw_method) for account in accounts]
+
+    def run():
+        for i in range(count // 2):
+            deposit[i % 100](50)
+            withdraw[i % 100](50)
+
+    elapsed = best_of(repeat, run)
+    return {'ops_per_sec': round(count / elapsed)}
+
+
+def bench_lookup(variant, sizes, lookups, scans, repeat):
+    """ns per lookup by account number: AccountRegistry vs a linear scan."""
+    results = {}
+    rng = random.Random(1)
+    for size in sizes:
+        registry = AccountRegistry()
+        accounts = []
+        for number in range(1, size + 1):
+            account = variant.factory(number, 1000)
+            registry.add(number, account)
+            accounts.append((number, account))
+        keys = [rng.randint(1, size) for _ in range(lookups)]
+        scan_keys = keys[:scans]
+
+        hashed = best_of(repeat, lambda: [registry.get(key) for key in keys])
+        scanned = best_of(1, lambda: [next((account for number, account in accounts
+                                            if number == key), None) for key in scan_keys])
+        results[str(size)] = {
+            'registry_ns': round(hashed / lookups * 1e9),
+            'linear_scan_ns': round(scanned / scans * 1e9),
+        }
+    return results
+
+
+def bench_memory(variant, count):
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    accounts = [variant.factory(number, 1000) for number in range(1, count + 1)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del accounts
+    # Includes the owner string each constructor stores and the list slot.
+    return {'bytes_per_account': round(used / count, 1)}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(max_accounts, repeat):
+    sizes = [10 ** power for power in range(3, 7) if 10 ** power <= max_accounts]
+    results = {}
+    # Most variants print every deposit and withdrawal.
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for variant in bank_variants():
+            results[variant.name] = {
+                'creation': bench_creation(variant, 100_000, repeat),
+                'transactions': bench_transactions(variant, 200_000, repeat),
+                'lookup': bench_lookup(variant, sizes, lookups=100_000, scans=20, repeat=repeat),
+                'memory': bench_memory(variant, 100_000),
+            }
+    return {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def report(data):
+    for name, cases in data['results'].items():
+        print(name)
+        print(f"  create:   {cases['creation']['accounts_per_sec']:>12,} accounts/s")
+        print(f"  deposit/withdraw: {cases['transactions']['ops_per_sec']:>10,} ops/s")
+        print(f"  memory:   {cases['memory']['bytes_per_account']:>12} bytes/account")
+        for size, lookup in cases['lookup'].items():
+            print(f"  lookup @ {int(size):>9,}: registry {lookup['registry_ns']:>6} ns, "
+                  f"linear scan {lookup['linear_scan_ns']:>12,} ns")
+
+
+def flatten(cases, prefix=''):
+    for key, value in cases.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+def compare(old_path, new_path):
+    """Print the relative change of every metric between two result files."""
+    with open(old_path) as file:
+        old = json.load(file)
+    with open(new_path) as file:
+        new = json.load(file)
+    print(f"{old_path} ({old.get('revision')}) -> {new_path} ({new.get('revision')})")
+    for name, cases in new['results'].items():
+        before = dict(flatten(old['results'].get(name, {})))
+        for metric, value in flatten(cases):
+            if before.get(metric):
+                change = (value - before[metric]) / before[metric] * 100
+                print(f"  {name:<30} {metric:<36} {before[metric]:>14,} -> {value:>14,} "
+                      f"({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks for every BankAccount variant")
+    parser.add_argument('--max-accounts', type=int, default=1_000_000,
+                        help="largest registry size for the lookup case (default: 10^6)")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per case; the best is kept")
+    parser.add_argument('--output', default=RESULTS, help="where to save the JSON results")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help="compare two saved result files instead of running")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    data = run(args.max_accounts, args.repeat)
+    report(data)
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w') as file:
+        json.dump(data, file, indent=2)
+    print(f"Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
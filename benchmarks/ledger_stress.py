@@ -0,0 +1,82 @@
+import contextlib
+import json
+import os
+import platform
+import random
+import threading
+import time
+
+from bank_accounts import git_revision
+from variants import ROOT, bank_variants
+from concurrent_ledger import ConcurrentLedger
+
+RESULTS = os.path.join(ROOT, 'benchmarks', 'results', 'ledger_throughput.json')
+
+
+def stress(variant, threads, accounts=1000, operations=20_000, opening=1000, seed=1):
+    """Hammer one ledger from `threads` threads; returns operations per second.
+
+    Transfers must leave the total unchanged, and every accepted deposit or
+    withdrawal is counted, so the final total has to equal the opening total
+    plus those amounts. No balance may end up negative.
+    """
+    ledger = ConcurrentLedger(balance_attr=variant.balance_attr,
+                              deposit_method=variant.deposit_method,
+                              withdraw_method=variant.withdraw_method)
+    for number in range(1, accounts + 1):
+        ledger.add(number, variant.factory(number, opening))
+    start_total = ledger.total()
+    net = [0] * threads
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        for _ in range(operations):
+            source = rng.randint(1, accounts)
+            amount = rng.randint(1, 600)
+            roll = rng.random()
+            if roll < 0.6:
+                ledger.transfer(source, rng.randint(1, accounts), amount)
+            elif roll < 0.8:
+                if ledger.deposit(source, amount):
+                    net[index] += amount
+            elif ledger.withdraw(source, amount):
+                net[index] -= amount
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    began = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    assert ledger.total() == start_total + sum(net), f"{variant.name}: money was not conserved"
+    assert all(ledger.balance(number) >= 0 for number in range(1, accounts + 1)), \
+        f"{variant.name}: negative balance"
+    return threads * operations / elapsed
+
+
+def main(thread_counts=(1, 2, 4, 8, 16)):
+    results = {}
+    # The Task 2/3/4 accounts print every operation.
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        variants = bank_variants()
+        for variant in variants:
+            results[variant.name] = {
+                str(threads): round(stress(variant, threads)) for threads in thread_counts
+            }
+
+    for name, by_threads in results.items():
+        print(name)
+        for threads, ops in by_threads.items():
+            print(f"  {threads:>2} thread(s): {ops:>10,} ops/s, money conserved")
+
+    os.makedirs(os.path.dirname(RESULTS), exist_ok=True)
+    with open(RESULTS, 'w') as file:
+        json.dump({'revision': git_revision(), 'python': platform.python_version(),
+                   'machine': platform.machine(), 'ops_per_second': results}, file, indent=2)
+    print(f"Saved to {os.path.relpath(RESULTS, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
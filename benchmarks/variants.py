@@ -0,0 +1,61 @@
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, 'common'))
+
+
+def load_script(relative_path, name):
+    """Import one of the task scripts by path; their file names are not
+    valid module names and their menus only run under __main__."""
+    path = os.path.join(ROOT, relative_path)
+    folder = os.path.dirname(path)
+    if folder not in sys.path:
+        sys.path.append(folder)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Variant:
+    """How to build and drive one BankAccount implementation."""
+
+    def __init__(self, name, factory, balance_attr='balance',
+                 deposit_method='deposit', withdraw_method='withdraw'):
+        self.name = name
+        # factory(number, balance) -> account
+        self.factory = factory
+        self.balance_attr = balance_attr
+        self.deposit_method = deposit_method
+        self.withdraw_method = withdraw_method
+
+
+def bank_variants():
+    task2 = load_script('Task 2/Bank-Account-System.py', 'bank_account_system')
+    task2_p = load_script('Task 2/P.py', 'p')
+    task3 = load_script('Task 3/Bankk.py', 'bankk')
+    task4 = load_script('Task 4/bank.py', 'bank')
+    task10 = load_script('Task 10/class&static_method.py', 'class_static_method')
+    # These benchmarks time account bookkeeping. The deliberately slow PIN
+    # hash (timed by Task 3/benchmark_sessions.py) would take hours at
+    # these account counts, so keep it to a single round here.
+    task3.BankAccount.PIN_ITERATIONS = 1
+    return [
+        Variant('Task 2 BankAccount',
+                lambda number, balance: task2.BankAccount(f"Owner {number}", number, balance)),
+        Variant('Task 2 P.py BankAccount',
+                lambda number, balance: task2_p.BankAccount(f"Owner {number}", balance)),
+        Variant('Task 3 BankAccount',
+                lambda number, balance: task3.BankAccount(f"Owner {number}", balance, '1234', number),
+                balance_attr='_balance'),
+        Variant('Task 4 BankAccount',
+                lambda number, balance: task4.BankAccount(number, balance)),
+        Variant('Task 4 SavingsAccount',
+                lambda number, balance: task4.SavingsAccount(number, balance)),
+        Variant('Task 4 PremiumSavingsAccount',
+                lambda number, balance: task4.PremiumSavingsAccount(number, balance)),
+        Variant('Task 10 BankAccount',
+                lambda number, balance: task10.BankAccount(f"Owner {number}", balance)),
+    ]
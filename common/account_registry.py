@@ -0,0 +1,55 @@
+class AccountRegistry:
+    """Accounts indexed by account number, with a secondary owner index.
+
+    Lookups, inserts and removals are O(1). Account numbers come from a
+    counter that only moves forward, so a number is never handed out twice
+    even after accounts are removed.
+    """
+
+    def __init__(self, first_number=1):
+        self._accounts = {}
+        self._owners = {}
+        self._by_owner = {}
+        self._next_number = first_number
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def __iter__(self):
+        # Accounts in the order they were added.
+        return iter(self._accounts.values())
+
+    def __contains__(self, number):
+        return number in self._accounts
+
+    def next_number(self):
+        number = self._next_number
+        self._next_number += 1
+        return number
+
+    def add(self, number, account, owner=None):
+        if number in self._accounts:
+            raise ValueError(f"Account number {number} is already registered.")
+        self._accounts[number] = account
+        if owner is not None:
+            self._owners[number] = owner
+            self._by_owner.setdefault(owner, {})[number] = account
+        # Numbers assigned by hand must not be handed out again later.
+        if isinstance(number, int) and number >= self._next_number:
+            self._next_number = number + 1
+
+    def get(self, number):
+        return self._accounts.get(number)
+
+    def remove(self, number):
+        account = self._accounts.pop(number)
+        owner = self._owners.pop(number, None)
+        if owner is not None:
+            accounts = self._by_owner[owner]
+            del accounts[number]
+            if not accounts:
+                del self._by_owner[owner]
+        return account
+
+    def find_by_owner(self, owner):
+        return list(self._by_owner.get(owner, {}).values())
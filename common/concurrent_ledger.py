@@ -0,0 +1,92 @@
+import threading
+
+
+class ConcurrentLedger:
+    """Thread-safe deposits, withdrawals and transfers on BankAccount objects.
+
+    Each account maps to one of `stripes` locks, so threads working on
+    different accounts rarely wait for each other and memory stays bounded
+    however many accounts there are. Operations call the account's own
+    methods while holding its lock, so every BankAccount variant keeps its
+    own rules (withdrawal limits, amount checks). A withdrawal counts as
+    accepted when it lowered the balance.
+
+    The attribute and method names differ between variants, e.g. the Task 3
+    account keeps its balance in `_balance` behind a read-only property.
+    """
+
+    def __init__(self, stripes=64, balance_attr='balance',
+                 deposit_method='deposit', withdraw_method='withdraw'):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._accounts = {}
+        self.balance_attr = balance_attr
+        self.deposit_method = deposit_method
+        self.withdraw_method = withdraw_method
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def add(self, number, account):
+        with self._lock_for(number):
+            self._accounts[number] = account
+
+    def balance(self, number):
+        with self._lock_for(number):
+            return getattr(self._accounts[number], self.balance_attr)
+
+    def deposit(self, number, amount):
+        with self._lock_for(number):
+            return self._deposit(self._accounts[number], amount)
+
+    def withdraw(self, number, amount):
+        with self._lock_for(number):
+            return self._withdraw(self._accounts[number], amount)
+
+    def transfer(self, source, target, amount):
+        """Move `amount` between two accounts atomically; returns True on
+        success, False if the withdrawal or deposit was refused."""
+        source_account = self._accounts[source]
+        target_account = self._accounts[target]
+        # Locks are always taken in stripe order, so two opposite transfers
+        # cannot each hold one lock and wait for the other.
+        locks = [self._locks[stripe]
+                 for stripe in sorted({self._stripe(source), self._stripe(target)})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            before = getattr(source_account, self.balance_attr)
+            if not self._withdraw(source_account, amount):
+                return False
+            if not self._deposit(target_account, amount):
+                setattr(source_account, self.balance_attr, before)
+                return False
+            return True
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def total(self):
+        """Sum of all balances, taken while holding every lock."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return sum(getattr(account, self.balance_attr) for account in self._accounts.values())
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _stripe(self, number):
+        return hash(number) % len(self._locks)
+
+    def _lock_for(self, number):
+        return self._locks[self._stripe(number)]
+
+    def _deposit(self, account, amount):
+        before = getattr(account, self.balance_attr)
+        getattr(account, self.deposit_method)(amount)
+        return getattr(account, self.balance_attr) != before
+
+    def _withdraw(self, account, amount):
+        before = getattr(account, self.balance_attr)
+        getattr(account, self.withdraw_method)(amount)
+        return getattr(account, self.balance_attr) < before